@@ -29,14 +29,24 @@ The password will be prompted securely (hidden input).
 from __future__ import annotations
 
 import argparse
-import getpass
+import array
+import bisect
+import functools
+import hashlib
 import json
+import os
+import re
+import select
 import socket
 import ssl
 import sys
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlencode
 
 # Check for required modules
@@ -49,12 +59,54 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
     REQUESTS_VERSION = requests.__version__
 except ImportError:
     print("ERROR: 'requests' module not found. Install with: pip install requests")
     sys.exit(1)
 
+# Optional: httpx as --http-backend, h2 adds HTTP/2 support
+try:
+    import httpx
+
+    HTTPX_VERSION = httpx.__version__
+except ImportError:
+    httpx = None
+    HTTPX_VERSION = None
+
+# Optional: cryptography parses the server certificate in-process (else: openssl binary)
+try:
+    from cryptography import x509
+
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# Optional: orjson decodes response bodies faster than the stdlib json module
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Optional: zstandard lets urllib3 2.x / httpx 0.27+ decode zstd-compressed responses
+try:
+    import zstandard  # noqa: F401
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 # =============================================================================
 # Helper Classes and Functions
@@ -76,22 +128,35 @@ class Colors:
     def disable(cls):
         """Disable colors for non-terminal output."""
         cls.GREEN = cls.RED = cls.YELLOW = cls.BLUE = cls.CYAN = cls.BOLD = cls.END = ""
+        _set_status_prefixes()
+
+
+def _set_status_prefixes() -> None:
+    """(Re)build the colored symbol prefixes used by ok/fail/warn/info."""
+    global _OK, _FAIL, _WARN, _INFO
+    _OK = f"{Colors.GREEN}✓ "
+    _FAIL = f"{Colors.RED}✗ "
+    _WARN = f"{Colors.YELLOW}⚠ "
+    _INFO = f"{Colors.BLUE}ℹ "
+
+
+_set_status_prefixes()
 
 
 def ok(msg):
-    return f"{Colors.GREEN}✓ {msg}{Colors.END}"
+    return f"{_OK}{msg}{Colors.END}"
 
 
 def fail(msg):
-    return f"{Colors.RED}✗ {msg}{Colors.END}"
+    return f"{_FAIL}{msg}{Colors.END}"
 
 
 def warn(msg):
-    return f"{Colors.YELLOW}⚠ {msg}{Colors.END}"
+    return f"{_WARN}{msg}{Colors.END}"
 
 
 def info(msg):
-    return f"{Colors.BLUE}ℹ {msg}{Colors.END}"
+    return f"{_INFO}{msg}{Colors.END}"
 
 
 def print_header(title):
@@ -109,20 +174,58 @@ def print_subheader(title):
 # Global redact settings
 REDACT_ENABLED = False
 REDACT_VALUES: List[str] = []
+REDACT_SET: Set[str] = set()  # membership index for REDACT_VALUES
 REDACT_REPLACEMENT = "***redacted***"
+_REDACT_RE: Optional[re.Pattern] = None
+_REDACT_DIRTY = False
+
+
+def update_redact_pattern() -> None:
+    """Mark the redaction pattern stale; call after changing REDACT_VALUES.
+
+    The pattern is recompiled lazily by the next redact() call, so several
+    appends in a row cost a single compile.
+    """
+    global _REDACT_DIRTY
+    _REDACT_DIRTY = True
+
+
+def _add_redact(value: Optional[str]) -> None:
+    """Add a value to the redaction list unless empty or already present."""
+    if value and value not in REDACT_SET:
+        REDACT_SET.add(value)
+        REDACT_VALUES.append(value)
+        update_redact_pattern()
+
+
+def _compile_redact_pattern() -> Optional[re.Pattern]:
+    global _REDACT_RE, _REDACT_DIRTY
+    # Longest values first so a secret containing another one is replaced whole
+    values = sorted({v for v in REDACT_VALUES if v and len(v) > 2}, key=len, reverse=True)
+    _REDACT_RE = re.compile("|".join(map(re.escape, values)), re.IGNORECASE) if values else None
+    _REDACT_DIRTY = False
+    _redact_sub.cache_clear()
+    return _REDACT_RE
+
+
+@functools.lru_cache(maxsize=1024)
+def _redact_sub(text: str) -> str:
+    # Host, user and object names are printed many times; cleared on recompile
+    return _REDACT_RE.sub(REDACT_REPLACEMENT, text)
+
+
+def _no_redact(text):
+    return text
 
 
 def redact(text):
     """Redact sensitive values from text if redaction is enabled."""
     if not REDACT_ENABLED or not text:
         return text
-    result = str(text)
-    for value in REDACT_VALUES:
-        if value and len(value) > 2:
-            result = result.replace(value, REDACT_REPLACEMENT)
-            result = result.replace(value.lower(), REDACT_REPLACEMENT)
-            result = result.replace(value.upper(), REDACT_REPLACEMENT)
-    return result
+    pattern = _compile_redact_pattern() if _REDACT_DIRTY else _REDACT_RE
+    if pattern is None:
+        return text
+    return _redact_sub(str(text))
 
 
 # =============================================================================
@@ -130,55 +233,74 @@ def redact(text):
 # =============================================================================
 
 
+def elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since start_ns, a time.perf_counter_ns() value."""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
 class TimingTracker:
     """Track timing for API calls."""
 
-    def __init__(self):
-        self.timings: List[Tuple[str, float, int]] = []  # (name, elapsed_ms, count)
-        self.start_time = time.time()
+    # Row color by duration: <= 500ms green, <= 1000ms yellow, above red
+    COLOR_TIERS = (500.0, 1000.0)
 
-    def add(self, name: str, elapsed_ms: float, count: int = 1) -> None:
-        self.timings.append((name, elapsed_ms, count))
+    def __init__(self):
+        # Parallel arrays instead of a list of (name, elapsed_ms, count, latency_ms) tuples
+        self._names: List[str] = []
+        self._elapsed = array.array("d")
+        self._counts = array.array("i")
+        self._latencies = array.array("d")
+        self.start_ns = time.perf_counter_ns()
+
+    def add(self, name: str, elapsed_ms: float, count: int = 1, latency_ms: Optional[float] = None) -> None:
+        """Record an entry; latency_ms is the summed call time if the calls ran concurrently."""
+        self._names.append(name)
+        self._elapsed.append(elapsed_ms)
+        self._counts.append(count)
+        self._latencies.append(elapsed_ms if latency_ms is None else latency_ms)
 
     def get_total_time(self) -> float:
-        return (time.time() - self.start_time) * 1000
+        return elapsed_ms(self.start_ns)
+
+    def get_total_api_time(self) -> float:
+        """Sum of all call latencies: the time a sequential client (the special agent) would need."""
+        return sum(self._latencies)
 
     def print_summary(self) -> None:
         print_header("TIMING SUMMARY")
 
-        if not self.timings:
+        if not self._names:
             print(info("No timing data collected"))
             return
 
-        sorted_timings = sorted(self.timings, key=lambda x: x[1], reverse=True)
+        order = sorted(range(len(self._elapsed)), key=self._elapsed.__getitem__, reverse=True)
 
-        print(f"\n{Colors.BOLD}Individual API Calls (sorted by duration):{Colors.END}")
-        print("-" * 60)
+        colors = (Colors.GREEN, Colors.YELLOW, Colors.RED)
+        total_api_time = self.get_total_api_time()
+        total_calls = sum(self._counts)
 
-        total_api_time = 0.0
-        total_calls = 0
-        for name, elapsed, count in sorted_timings:
-            total_api_time += elapsed
-            total_calls += count
-            if elapsed > 1000:
-                color = Colors.RED
-            elif elapsed > 500:
-                color = Colors.YELLOW
-            else:
-                color = Colors.GREEN
+        lines = [f"\n{Colors.BOLD}Individual API Calls (sorted by duration):{Colors.END}", "-" * 60]
+        for i in order:
+            name, elapsed, count = self._names[i], self._elapsed[i], self._counts[i]
+            color = colors[bisect.bisect_left(self.COLOR_TIERS, elapsed)]
             count_str = f" ({count} calls)" if count > 1 else ""
-            print(f"  {color}{elapsed:>8.0f}ms{Colors.END}  {name}{count_str}")
-
-        print("-" * 60)
-        print(f"  {Colors.BOLD}{total_api_time:>8.0f}ms{Colors.END}  Total API time ({total_calls} calls)")
-
-        total_time = self.get_total_time()
-        print(f"  {Colors.BOLD}{total_time:>8.0f}ms{Colors.END}  Total script time")
+            lines.append(f"  {color}{elapsed:>8.0f}ms{Colors.END}  {name}{count_str}")
+        lines.append("-" * 60)
+        lines.append(
+            f"  {Colors.BOLD}{total_api_time:>8.0f}ms{Colors.END}  "
+            f"Sequential-equivalent API time (sum of {total_calls} call latencies)"
+        )
+        lines.append(
+            f"  {Colors.BOLD}{self.get_total_time():>8.0f}ms{Colors.END}  "
+            "Total script time (wall clock; concurrent calls overlap)"
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
+        # The special agent fetches one call after another, so it pays the summed latencies
         if total_api_time > 30000:
-            print(f"\n{warn('API time exceeds 30 seconds - may cause CheckMK timeouts!')}")
+            print(f"\n{warn('Sequential API time exceeds 30 seconds - the special agent may hit CheckMK timeouts!')}")
         elif total_api_time > 15000:
-            print(f"\n{warn('API time exceeds 15 seconds - consider optimizing')}")
+            print(f"\n{warn('Sequential API time exceeds 15 seconds - consider optimizing')}")
 
 
 class TestResults:
@@ -199,6 +321,11 @@ class TestResults:
         if detail:
             self.details[f"{category}:{test_name}"] = detail
 
+    def discard(self, category: str, test_name: str) -> None:
+        """Drop earlier results of a test that is about to be repeated."""
+        self.results = [r for r in self.results if r[:2] != (category, test_name)]
+        self.details.pop(f"{category}:{test_name}", None)
+
     def print_summary(self) -> None:
         print_header("TEST SUMMARY")
 
@@ -232,17 +359,21 @@ def test_dns_resolution(host: str, results: TestResults) -> Optional[str]:
     print_subheader("DNS Resolution")
 
     try:
-        socket.inet_aton(host)
+        # Numeric IPv4/IPv6 addresses are accepted without asking DNS
+        socket.getaddrinfo(host, None, flags=socket.AI_NUMERICHOST)
         print(info(f"Host '{redact(host)}' is already an IP address"))
         results.add("Network", "DNS Resolution", True, "IP address provided")
         return host
-    except socket.error:
+    except socket.gaierror:
         pass
 
     try:
-        ip = socket.gethostbyname(host)
-        print(ok(f"Resolved '{redact(host)}' to {redact(ip)}"))
-        results.add("Network", "DNS Resolution", True, f"Resolved to {redact(ip)}")
+        # AI_ADDRCONFIG: no AAAA lookup on hosts without IPv6 (and vice versa)
+        addr_info = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM, flags=socket.AI_ADDRCONFIG)
+        ip = addr_info[0][4][0]
+        shown_ip = redact(ip)
+        print(ok(f"Resolved '{redact(host)}' to {shown_ip}"))
+        results.add("Network", "DNS Resolution", True, f"Resolved to {shown_ip}")
         return ip
     except socket.gaierror as e:
         print(fail(f"DNS resolution failed for '{redact(host)}': {e}"))
@@ -250,38 +381,68 @@ def test_dns_resolution(host: str, results: TestResults) -> Optional[str]:
         return None
 
 
-def test_tcp_connection(host: str, port: int, results: TestResults) -> bool:
-    """Test TCP connection to host:port."""
+def test_tcp_connection(ip: str, port: int, results: TestResults, timeout: float = 5.0) -> Optional[socket.socket]:
+    """Test TCP connection to an already resolved ip:port.
+
+    Returns the connected socket (blocking, same timeout) so the SSL test can
+    reuse it, or None if the port is not reachable. The caller closes it.
+    """
     print_subheader(f"TCP Connection (Port {port})")
 
+    sock = socket.socket(socket.AF_INET6 if ":" in ip else socket.AF_INET, socket.SOCK_STREAM)
     try:
-        start = time.time()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5)
-        result = sock.connect_ex((host, port))
-        elapsed = (time.time() - start) * 1000
-        sock.close()
+        start = time.perf_counter_ns()
+        # Non-blocking connect + select: bounded by timeout, no name lookup
+        sock.setblocking(False)
+        try:
+            sock.connect((ip, port))
+        except BlockingIOError:
+            pass
+        # Windows reports a refused connect only in exceptfds
+        _, writable, errored = select.select([], [sock], [sock], timeout)
+        if not writable and not errored:
+            raise socket.timeout()
+        result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        elapsed = elapsed_ms(start)
 
         if result == 0:
             print(ok(f"Port {port} is open (connected in {elapsed:.1f}ms)"))
             results.add("Network", f"TCP Port {port}", True, f"{elapsed:.1f}ms")
-            return True
+            sock.settimeout(timeout)
+            return sock
         else:
             print(fail(f"Port {port} is closed or filtered"))
             results.add("Network", f"TCP Port {port}", False, "Connection refused")
-            return False
     except socket.timeout:
         print(fail(f"Connection to port {port} timed out"))
         results.add("Network", f"TCP Port {port}", False, "Timeout")
-        return False
     except Exception as e:
         print(fail(f"Connection error: {e}"))
         results.add("Network", f"TCP Port {port}", False, str(e))
-        return False
+    sock.close()
+    return None
+
+
+def _parse_certificate(der_cert: bytes, cert_info: Dict[str, Any]) -> None:
+    """Fill subject/issuer/validity in cert_info from a DER certificate (needs cryptography)."""
+    cert = x509.load_der_x509_certificate(der_cert)
+    cert_info["subject"] = cert.subject.rfc4514_string()
+    cert_info["issuer"] = cert.issuer.rfc4514_string()
+    # *_utc attributes exist since cryptography 42
+    cert_info["not_before"] = getattr(cert, "not_valid_before_utc", None) or cert.not_valid_before
+    cert_info["not_after"] = getattr(cert, "not_valid_after_utc", None) or cert.not_valid_after
+
+
+def _add_certificate_result(cert_info: Dict[str, Any], results: TestResults) -> None:
+    if cert_info.get("subject") == cert_info.get("issuer"):
+        print(warn("Certificate is SELF-SIGNED"))
+        results.add_warning("SSL/TLS", "Certificate", "Self-signed certificate")
+    else:
+        results.add("SSL/TLS", "Certificate", True)
 
 
-def test_ssl_certificate(host: str, port: int, results: TestResults) -> Dict[str, Any]:
-    """Test SSL/TLS connection and get certificate details."""
+def test_ssl_certificate(sock: socket.socket, host: str, results: TestResults) -> Dict[str, Any]:
+    """Test SSL/TLS handshake on the socket from test_tcp_connection and get certificate details."""
     print_subheader("SSL/TLS Certificate")
 
     cert_info: Dict[str, Any] = {}
@@ -291,14 +452,12 @@ def test_ssl_certificate(host: str, port: int, results: TestResults) -> Dict[str
         context.check_hostname = False
         context.verify_mode = ssl.CERT_NONE
 
-        with socket.create_connection((host, port), timeout=5) as sock:
+        with sock:
             with context.wrap_socket(sock, server_hostname=host) as ssock:
                 cert = ssock.getpeercert(binary_form=True)
                 cipher = ssock.cipher()
                 version = ssock.version()
 
-                cert_decoded = ssl.DER_cert_to_PEM_cert(cert)
-
                 print(ok("SSL/TLS Handshake successful"))
                 print(f"    Protocol: {version}")
                 print(f"    Cipher: {cipher[0]} ({cipher[2]} bits)")
@@ -307,33 +466,44 @@ def test_ssl_certificate(host: str, port: int, results: TestResults) -> Dict[str
                 cert_info["cipher"] = cipher[0]
                 cert_info["bits"] = cipher[2]
 
-                try:
-                    import subprocess
-
-                    proc = subprocess.run(
-                        ["openssl", "x509", "-noout", "-subject", "-issuer", "-dates"],
-                        input=cert_decoded.encode(),
-                        capture_output=True,
-                        timeout=5,
-                    )
-                    if proc.returncode == 0:
-                        output = proc.stdout.decode()
+                if CRYPTOGRAPHY_AVAILABLE:
+                    try:
+                        _parse_certificate(cert, cert_info)
                         print("\n    Certificate Details:")
-                        for line in output.strip().split("\n"):
-                            print(f"      {line}")
-                            if "subject=" in line.lower():
-                                cert_info["subject"] = line.split("=", 1)[1] if "=" in line else line
-                            elif "issuer=" in line.lower():
-                                cert_info["issuer"] = line.split("=", 1)[1] if "=" in line else line
-
-                        if cert_info.get("subject") == cert_info.get("issuer"):
-                            print(warn("Certificate is SELF-SIGNED"))
-                            results.add_warning("SSL/TLS", "Certificate", "Self-signed certificate")
-                        else:
-                            results.add("SSL/TLS", "Certificate", True)
-                except Exception:
-                    print(info("(Could not parse certificate details - openssl not available)"))
-                    results.add("SSL/TLS", "Certificate", True, "Details unavailable")
+                        print(f"      subject={cert_info['subject']}")
+                        print(f"      issuer={cert_info['issuer']}")
+                        print(f"      notBefore={cert_info['not_before']}")
+                        print(f"      notAfter={cert_info['not_after']}")
+                        _add_certificate_result(cert_info, results)
+                    except ValueError as e:
+                        print(info(f"(Could not parse certificate details: {e})"))
+                        results.add("SSL/TLS", "Certificate", True, "Details unavailable")
+                else:
+                    try:
+                        import subprocess
+
+                        # openssl reads PEM; cryptography works on the DER bytes directly
+                        cert_pem = ssl.DER_cert_to_PEM_cert(cert)
+                        proc = subprocess.run(
+                            ["openssl", "x509", "-noout", "-subject", "-issuer", "-dates"],
+                            input=cert_pem.encode(),
+                            capture_output=True,
+                            timeout=5,
+                        )
+                        if proc.returncode == 0:
+                            output = proc.stdout.decode()
+                            print("\n    Certificate Details:")
+                            for line in output.strip().split("\n"):
+                                print(f"      {line}")
+                                if "subject=" in line.lower():
+                                    cert_info["subject"] = line.split("=", 1)[1] if "=" in line else line
+                                elif "issuer=" in line.lower():
+                                    cert_info["issuer"] = line.split("=", 1)[1] if "=" in line else line
+
+                            _add_certificate_result(cert_info, results)
+                    except Exception:
+                        print(info("(Could not parse certificate details - openssl not available)"))
+                        results.add("SSL/TLS", "Certificate", True, "Details unavailable")
 
                 results.add("SSL/TLS", "Handshake", True, f"{version} / {cipher[0]}")
                 return cert_info
@@ -354,26 +524,248 @@ def test_ssl_certificate(host: str, port: int, results: TestResults) -> Dict[str
 
 API_VERSION = "1.3-rev1"
 
+# Upper bound for parallel API requests (--max-concurrency)
+MAX_CONCURRENCY = 8
+
+# Retry policy of the requests and urllib3 backends. raise_on_status=False
+# hands the last 502/503/504 back as a response so its status is reported
+# instead of a "Max retries exceeded" error. httpx has no status retries.
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+)
+
+
+# Exceptions raised by the HTTP backends (requests, urllib3, httpx)
+TIMEOUT_ERRORS: Tuple[type, ...] = (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError)
+REQUEST_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+if httpx is not None:
+    TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    REQUEST_ERRORS += (httpx.HTTPError,)
+
+
+def body_preview(response: Any, limit: int = 500) -> str:
+    """First limit characters of a response body, decoding only a bounded prefix."""
+    # 4 bytes per character covers any UTF-8 text
+    head = response.content[: limit * 4]
+    return head.decode(getattr(response, "encoding", None) or "utf-8", errors="replace")[:limit]
+
+
+class Urllib3Response:
+    """The parts of requests.Response used by this script, for a urllib3 response."""
+
+    def __init__(self, response: Any):
+        self.status_code = response.status
+        self.content = response.data
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json_loads(self.content)
+
+
+class Urllib3Session:
+    """Minimal requests.Session look-alike on top of urllib3.PoolManager.
+
+    Skips requests' request preparation and hooks while still reusing
+    pooled TLS connections; only .get()/.post() as used here are provided.
+    """
+
+    def __init__(self, verify_ssl: bool, headers: Dict[str, str]):
+        self.headers = dict(headers)
+        self._pool = urllib3.PoolManager(
+            maxsize=32,
+            cert_reqs="CERT_REQUIRED" if verify_ssl else "CERT_NONE",
+            retries=RETRY_POLICY,
+        )
+
+    def _request(self, method: str, url: str, headers: Optional[Dict[str, str]], timeout: float, **kwargs):
+        try:
+            response = self._pool.request(
+                method, url, headers={**self.headers, **(headers or {})}, timeout=timeout, **kwargs
+            )
+        except urllib3.exceptions.MaxRetryError as e:
+            # Surface the underlying timeout/connection error like requests does
+            if e.reason is not None:
+                raise e.reason from e
+            raise
+        return Urllib3Response(response)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Urllib3Response:
+        return self._request("GET", url, headers, timeout)
+
+    def post(
+        self, url: str, headers: Optional[Dict[str, str]] = None, data: Any = None, timeout: float = 30
+    ) -> Urllib3Response:
+        body = urlencode(data) if isinstance(data, dict) else data
+        return self._request("POST", url, headers, timeout, body=body)
+
+    def close(self) -> None:
+        self._pool.clear()
+
+
+def accept_encoding(backend: str) -> str:
+    """Return the Accept-Encoding to send; zstd only if the backend can decode it."""
+    if ZSTD_AVAILABLE:
+        # requests and the urllib3 backend both decode via urllib3
+        lib, min_version = (httpx, (0, 27)) if backend == "httpx" else (urllib3, (2, 0))
+        if tuple(int(part) for part in lib.__version__.split(".")[:2]) >= min_version:
+            return "zstd, gzip, deflate"
+    return "gzip, deflate"
+
+
+def build_session(verify_ssl: bool, backend: str = "requests") -> Any:
+    """Create the shared HTTP session for all API calls.
+
+    backend "requests" returns a requests.Session with a sized, retrying
+    connection pool; "urllib3" a thin Urllib3Session over a PoolManager;
+    "httpx" returns an httpx.Client that keeps one connection alive and
+    multiplexes requests over HTTP/2 if h2 is installed. All expose the
+    same .get()/.post() interface used by this script. requests and urllib3
+    share RETRY_POLICY; httpx does not retry, so a 502/503/504 is reported
+    at once instead of after about 2s of backoff.
+    """
+    headers = {
+        "x-api-version": API_VERSION,
+        "Accept": "application/json",
+        "Accept-Encoding": accept_encoding(backend),
+    }
+    if backend != "httpx":
+        # HTTP/1.1 only: connection-specific headers are not allowed with HTTP/2
+        headers["Connection"] = "keep-alive"
+    if backend == "urllib3":
+        return Urllib3Session(verify_ssl, headers)
+    if backend == "httpx":
+        return httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            verify=verify_ssl,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            headers=headers,
+        )
+
+    session = requests.Session()
+    session.verify = verify_ssl
+    if not verify_ssl:
+        # requests lets REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE override a session-level
+        # verify=False; ignore the environment so --no-cert-check always applies
+        session.trust_env = False
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+# Token cache for --reuse-token (one file per base_url/username, mode 0600)
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "veeam_debug")
+
+
+def token_cache_path(base_url: str, username: str) -> str:
+    """Return the token cache file for a base_url/username pair."""
+    key = hashlib.sha256(f"{base_url}\0{username}".encode("utf-8")).hexdigest()
+    return os.path.join(TOKEN_CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_token(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_token(path: str, token_data: Dict[str, Any]) -> None:
+    entry = {
+        "access_token": token_data.get("access_token"),
+        "expires_at_epoch": time.time() + token_data.get("expires_in", 0),
+        "refresh_token": token_data.get("refresh_token"),
+    }
+    try:
+        os.makedirs(TOKEN_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.chmod(path, 0o600)
+    except OSError as e:
+        print(warn(f"Could not write token cache: {e}"))
+
+
+def invalidate_cached_token(path: str) -> None:
+    """Remove a cached token, e.g. after the server rejected it."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=4)
+def bearer_headers(token: str) -> MappingProxyType:
+    """Per-call auth headers for token, built once and shared read-only."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
 
 def get_oauth_token(
-    session: requests.Session,
+    session: Any,
     base_url: str,
     username: str,
     password: str,
-    verify_ssl: bool,
     results: TestResults,
     timing: TimingTracker,
+    token_cache: Optional[str] = None,
 ) -> Optional[str]:
-    """Authenticate with Veeam REST API using OAuth2 password grant."""
+    """Authenticate with Veeam REST API using OAuth2 password grant.
+
+    If token_cache is given, a still valid cached token is reused without
+    contacting the server, and an expired one is renewed via its
+    refresh_token before falling back to the password grant.
+    """
     print_subheader("OAuth2 Authentication")
 
     token_url = f"{base_url}/api/oauth2/token"
     print(f"  URL: {redact(token_url)}")
 
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "x-api-version": API_VERSION,
-    }
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+    cached = _load_cached_token(token_cache) if token_cache else None
+    if cached and cached.get("access_token"):
+        remaining = cached.get("expires_at_epoch", 0) - time.time()
+        if remaining > 30:
+            print(ok(f"Using cached token (valid for another {remaining:.0f} seconds)"))
+            timing.add("OAuth2 Token (cached)", 0)
+            results.add("Auth", "OAuth2 Token", True, "cached")
+            return cached["access_token"]
+
+    if cached and cached.get("refresh_token"):
+        refresh_data = {"grant_type": "refresh_token", "refresh_token": cached["refresh_token"]}
+        try:
+            start = time.perf_counter_ns()
+            response = session.post(
+                token_url,
+                headers=headers,
+                data=refresh_data,
+                timeout=30,
+            )
+            elapsed = elapsed_ms(start)
+            timing.add("OAuth2 Token (refresh)", elapsed)
+            if response.status_code == 200:
+                token_data = response.json()
+                _save_cached_token(token_cache, token_data)
+                print(ok(f"Token refreshed ({elapsed:.0f}ms)"))
+                results.add("Auth", "OAuth2 Token", True, f"refreshed, {elapsed:.0f}ms")
+                return token_data.get("access_token")
+            print(info(f"Token refresh failed (HTTP {response.status_code}), using password grant"))
+        except REQUEST_ERRORS as e:
+            print(info(f"Token refresh failed ({e}), using password grant"))
+        invalidate_cached_token(token_cache)
 
     data = {
         "grant_type": "password",
@@ -382,15 +774,14 @@ def get_oauth_token(
     }
 
     try:
-        start = time.time()
+        start = time.perf_counter_ns()
         response = session.post(
             token_url,
             headers=headers,
-            data=urlencode(data),
+            data=data,
             timeout=30,
-            verify=verify_ssl,
         )
-        elapsed = (time.time() - start) * 1000
+        elapsed = elapsed_ms(start)
         timing.add("OAuth2 Token", elapsed)
 
         if response.status_code == 200:
@@ -404,6 +795,8 @@ def get_oauth_token(
             print(f"    Expires in: {expires_in} seconds")
 
             results.add("Auth", "OAuth2 Token", True, f"{elapsed:.0f}ms")
+            if token_cache:
+                _save_cached_token(token_cache, token_data)
             return access_token
         else:
             print(fail(f"Authentication failed: HTTP {response.status_code} ({elapsed:.0f}ms)"))
@@ -411,12 +804,12 @@ def get_oauth_token(
                 error_body = response.json()
                 print(f"    Error: {redact(json.dumps(error_body, indent=2))}")
             except json.JSONDecodeError:
-                print(f"    Response: {redact(response.text[:500])}")
+                print(f"    Response: {redact(body_preview(response))}")
 
             results.add("Auth", "OAuth2 Token", False, f"HTTP {response.status_code}")
             return None
 
-    except requests.exceptions.Timeout:
+    except TIMEOUT_ERRORS:
         print(fail("Authentication request timed out"))
         results.add("Auth", "OAuth2 Token", False, "Timeout")
         timing.add("OAuth2 Token", 30000)
@@ -428,123 +821,188 @@ def get_oauth_token(
 
 
 def api_get(
-    session: requests.Session,
+    session: Any,
     base_url: str,
     endpoint: str,
     token: str,
-    verify_ssl: bool,
     timeout: int = 30,
 ) -> Tuple[Optional[Any], float]:
     """Make a GET request to the API and return (data, elapsed_ms)."""
     url = f"{base_url}/api/v1/{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "x-api-version": API_VERSION,
-        "Accept": "application/json",
-    }
+    headers = bearer_headers(token)
 
-    start = time.time()
-    response = session.get(url, headers=headers, timeout=timeout, verify=verify_ssl)
-    elapsed = (time.time() - start) * 1000
+    start = time.perf_counter_ns()
+    response = session.get(url, headers=headers, timeout=timeout)
+    elapsed = elapsed_ms(start)
 
     if response.status_code == 200:
-        return response.json(), elapsed
+        return json_loads(response.content), elapsed
     return None, elapsed
 
 
+def api_get_many(
+    session: Any,
+    base_url: str,
+    endpoints: List[str],
+    token: str,
+    timeout: int = 30,
+    max_connections: int = 20,
+) -> List[Tuple[Optional[Any], float, Optional[Exception]]]:
+    """GET several endpoints concurrently over the shared session.
+
+    Returns (data, elapsed_ms, error) per endpoint, in request order.
+    api_get() calls run in a thread pool on the configured session (any
+    --http-backend), so they share its connection pool and retry policy.
+    At most MAX_CONCURRENCY (and max_connections) requests are in flight
+    at a time. Request and decode errors are returned as error instead of
+    being raised.
+    """
+    if not endpoints:
+        return []
+
+    def fetch(endpoint: str) -> Tuple[Optional[Any], float, Optional[Exception]]:
+        start = time.perf_counter_ns()
+        try:
+            data, elapsed = api_get(session, base_url, endpoint, token, timeout)
+            return data, elapsed, None
+        except Exception as e:
+            return None, elapsed_ms(start), e
+
+    if len(endpoints) <= 1:
+        return [fetch(endpoint) for endpoint in endpoints]
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, max_connections, len(endpoints))) as pool:
+        return list(pool.map(fetch, endpoints))
+
+
 def api_get_paginated(
-    session: requests.Session,
+    session: Any,
     base_url: str,
     endpoint: str,
     token: str,
-    verify_ssl: bool,
     limit: int = 500,
     extra_params: Optional[Dict[str, str]] = None,
-) -> Tuple[List[dict], float, int]:
-    """Get all items from a paginated endpoint. Returns (items, total_ms, call_count)."""
-    all_items = []
-    skip = 0
-    total_ms = 0.0
-    call_count = 0
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "x-api-version": API_VERSION,
-        "Accept": "application/json",
-    }
-
-    while True:
-        url = f"{base_url}/api/v1/{endpoint}?limit={limit}&skip={skip}"
-        if extra_params:
-            for key, value in extra_params.items():
-                url += f"&{key}={value}"
-        start = time.time()
-        response = session.get(url, headers=headers, timeout=60, verify=verify_ssl)
-        elapsed = (time.time() - start) * 1000
-        total_ms += elapsed
-        call_count += 1
-
-        if response.status_code != 200:
-            break
-
-        data = response.json()
-        items = data.get("data", []) if isinstance(data, dict) else data
-
-        if not items:
-            break
-
-        all_items.extend(items)
-
-        # Check pagination
-        if isinstance(data, dict):
-            pagination = data.get("pagination", {})
-            total = pagination.get("total", len(items))
-            if skip + len(items) >= total:
+) -> Tuple[List[dict], float, float, int, List[str]]:
+    """Get all items from a paginated endpoint.
+
+    Returns (items, total_ms, latency_ms, call_count, page_errors). The
+    first page is fetched on its own to learn pagination.total; the
+    remaining pages are then requested concurrently via api_get_many().
+    total_ms is wall-clock time; latency_ms is the sum of the individual
+    calls, i.e. what a sequential client such as the special agent would
+    wait. A page that fails is listed in page_errors ("skip=N: reason")
+    and its items are missing; the other pages are still collected.
+    """
+    # Only skip varies between pages; encode the rest of the query once
+    static_qs = f"&{urlencode(extra_params)}" if extra_params else ""
+    page_template = f"{endpoint}?limit={limit}&skip={{}}{static_qs}"
+    page_errors: List[str] = []
+
+    def page_error(skip: int, error: Optional[Exception]) -> str:
+        return f"skip={skip}: {error or 'no data (non-200 response)'}"
+
+    start = time.perf_counter_ns()
+    [(data, latency_ms, error)] = api_get_many(session, base_url, [page_template.format(0)], token, 60)
+    call_count = 1
+
+    if data is None:
+        return [], elapsed_ms(start), latency_ms, call_count, [page_error(0, error)]
+
+    items = data.get("data", []) if isinstance(data, dict) else data
+    all_items = list(items)
+
+    if isinstance(data, dict):
+        total = data.get("pagination", {}).get("total", len(items))
+        skips = list(range(limit, total, limit)) if items else []
+        if skips:
+            pages = api_get_many(
+                session,
+                base_url,
+                [page_template.format(skip) for skip in skips],
+                token,
+                timeout=60,
+                max_connections=16,
+            )
+            call_count += len(pages)
+            for skip, (page, page_ms, error) in zip(skips, pages):
+                latency_ms += page_ms
+                if page is None:
+                    page_errors.append(page_error(skip, error))
+                    continue
+                all_items.extend(page.get("data", []) if isinstance(page, dict) else page)
+    else:
+        # Plain list response without pagination info: page until a short page
+        skip = 0
+        while len(items) >= limit:
+            skip += limit
+            [(data, page_ms, error)] = api_get_many(session, base_url, [page_template.format(skip)], token, 60)
+            latency_ms += page_ms
+            call_count += 1
+            if data is None:
+                # The end of the list is unknown, so later pages cannot be fetched either
+                page_errors.append(page_error(skip, error))
                 break
-        elif len(items) < limit:
-            break
+            items = data if isinstance(data, list) else []
+            all_items.extend(items)
 
-        skip += limit
+    return all_items, elapsed_ms(start), latency_ms, call_count, page_errors
 
-    return all_items, total_ms, call_count
 
+def print_page_errors(page_errors: List[str]) -> None:
+    """List the pages api_get_paginated() could not fetch."""
+    if page_errors:
+        print(f"    {warn(f'{len(page_errors)} page(s) failed, item count is incomplete:')}")
+        for page_error in page_errors:
+            print(f"      {redact(page_error)}")
 
-def test_api_endpoint(
-    session: requests.Session,
+
+def fetch_api_endpoint(
+    session: Any,
     base_url: str,
     endpoint: str,
     token: str,
+    timeout: int = 30,
+) -> Tuple[Any, float]:
+    """GET an endpoint for report_api_endpoint(). Returns (response or exception, elapsed_ms)."""
+    url = f"{base_url}/api/v1/{endpoint}"
+    # x-api-version and Accept are set on the session (build_session)
+    start = time.perf_counter_ns()
+    try:
+        response = session.get(url, headers=bearer_headers(token), timeout=timeout)
+    except Exception as e:
+        return e, elapsed_ms(start)
+    return response, elapsed_ms(start)
+
+
+def report_api_endpoint(
+    fetched: Tuple[Any, float],
+    base_url: str,
+    endpoint: str,
     test_name: str,
     results: TestResults,
     category: str,
-    verify_ssl: bool,
     timing: TimingTracker,
     show_data: bool = False,
 ) -> Optional[Any]:
-    """Test a Veeam REST API endpoint."""
+    """Print and record the outcome of fetch_api_endpoint(). Returns the parsed data."""
     url = f"{base_url}/api/v1/{endpoint}"
 
     print(f"\n  Testing: {test_name}")
     print(f"  URL: {redact(url)}")
 
-    headers = {
-        "Authorization": f"Bearer {token[:20]}...{token[-10:]}" if len(token) > 30 else f"Bearer {token}",
-        "x-api-version": API_VERSION,
-        "Accept": "application/json",
-    }
     print(f"  Headers: x-api-version={API_VERSION}")
 
-    # Use actual token for request
-    real_headers = {
-        "Authorization": f"Bearer {token}",
-        "x-api-version": API_VERSION,
-        "Accept": "application/json",
-    }
+    response, elapsed = fetched
+    if isinstance(response, TIMEOUT_ERRORS):
+        print(f"  {fail('Request timed out')}")
+        results.add(category, test_name, False, "Timeout")
+        timing.add(test_name, 30000)
+        return None
+    if isinstance(response, Exception):
+        print(f"  {fail(f'Error: {response}')}")
+        results.add(category, test_name, False, str(response))
+        return None
 
     try:
-        start = time.time()
-        response = session.get(url, headers=real_headers, timeout=30, verify=verify_ssl)
-        elapsed = (time.time() - start) * 1000
         timing.add(test_name, elapsed)
 
         status_ok = response.status_code == 200
@@ -554,48 +1012,97 @@ def test_api_endpoint(
         else:
             print(f"  {fail(f'Status: {response.status_code} ({elapsed:.0f}ms)')}")
 
+        try:
+            parsed = json_loads(response.content)
+        except json.JSONDecodeError:
+            parsed = None
+
         if show_data or not status_ok:
-            try:
-                json_resp = response.json()
-                if isinstance(json_resp, dict) and "data" in json_resp:
-                    items = json_resp["data"]
-                    print(f"    Response: {len(items)} items")
-                    if items and show_data:
-                        print(f"    First item: {redact(json.dumps(items[0], indent=4)[:500])}")
-                elif isinstance(json_resp, list):
-                    print(f"    Response: {len(json_resp)} items")
-                    if json_resp and show_data:
-                        print(f"    First item: {redact(json.dumps(json_resp[0], indent=4)[:500])}")
-                else:
-                    print(f"    Response: {redact(json.dumps(json_resp, indent=4)[:500])}")
-            except json.JSONDecodeError:
-                print(f"    Response: {redact(response.text[:500])}")
+            # Previews are cut to 500 chars, so serialize compactly
+            if parsed is None:
+                print(f"    Response: {redact(body_preview(response))}")
+            elif isinstance(parsed, dict) and "data" in parsed:
+                items = parsed["data"]
+                print(f"    Response: {len(items)} items")
+                if items and show_data:
+                    print(f"    First item: {redact(json.dumps(items[0], separators=(',', ':'))[:500])}")
+            elif isinstance(parsed, list):
+                print(f"    Response: {len(parsed)} items")
+                if parsed and show_data:
+                    print(f"    First item: {redact(json.dumps(parsed[0], separators=(',', ':'))[:500])}")
+            else:
+                print(f"    Response: {redact(json.dumps(parsed, separators=(',', ':'))[:500])}")
 
         results.add(category, test_name, status_ok, f"HTTP {response.status_code}")
 
-        if status_ok:
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return None
-        return None
+        return parsed if status_ok else None
 
-    except requests.exceptions.Timeout:
-        print(f"  {fail('Request timed out')}")
-        results.add(category, test_name, False, "Timeout")
-        timing.add(test_name, 30000)
-        return None
     except Exception as e:
         print(f"  {fail(f'Error: {e}')}")
         results.add(category, test_name, False, str(e))
         return None
 
 
+def test_api_endpoint(
+    session: Any,
+    base_url: str,
+    endpoint: str,
+    token: str,
+    test_name: str,
+    results: TestResults,
+    category: str,
+    timing: TimingTracker,
+    show_data: bool = False,
+) -> Optional[Any]:
+    """Test a Veeam REST API endpoint."""
+    fetched = fetch_api_endpoint(session, base_url, endpoint, token)
+    return report_api_endpoint(fetched, base_url, endpoint, test_name, results, category, timing, show_data)
+
+
+def fetch_api_endpoints(
+    session: Any,
+    base_url: str,
+    endpoints: List[str],
+    token: str,
+) -> List[Tuple[Any, float]]:
+    """Run fetch_api_endpoint() for all endpoints concurrently (up to MAX_CONCURRENCY) over the shared session."""
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENCY, len(endpoints)))) as pool:
+        return list(pool.map(lambda endpoint: fetch_api_endpoint(session, base_url, endpoint, token), endpoints))
+
+
+def test_api_endpoints(
+    session: Any,
+    base_url: str,
+    endpoints: List[Tuple[str, str]],
+    token: str,
+    results: TestResults,
+    category: str,
+    timing: TimingTracker,
+    show_data: bool = False,
+    cache: Optional[Dict[str, Any]] = None,
+    fetched: Optional[List[Tuple[Any, float]]] = None,
+) -> Iterator[Optional[Any]]:
+    """Test several (endpoint, test_name) pairs.
+
+    All requests run concurrently over the shared session first (unless
+    already done via fetch_api_endpoints() and passed as fetched); the
+    reports are then printed in the given order as the caller iterates,
+    yielding the parsed data per endpoint. Successful responses are also
+    stored in cache (keyed by endpoint) for later tests to reuse.
+    """
+    if fetched is None:
+        fetched = fetch_api_endpoints(session, base_url, [endpoint for endpoint, _ in endpoints], token)
+    for result, (endpoint, name) in zip(fetched, endpoints):
+        data = report_api_endpoint(result, base_url, endpoint, name, results, category, timing, show_data)
+        if cache is not None and data is not None:
+            cache[endpoint] = data
+        yield data
+
+
 def run_performance_test(
-    session: requests.Session,
+    session: Any,
     base_url: str,
     token: str,
-    verify_ssl: bool,
     timing: TimingTracker,
     max_objects: int = 10,
     restore_points_days: int = 7,
@@ -606,11 +1113,13 @@ def run_performance_test(
     print_subheader("Fetching Backup Objects")
 
     # Get backup objects
-    backup_objects, bo_time, bo_calls = api_get_paginated(
-        session, base_url, "backupObjects", token, verify_ssl
+    backup_objects, bo_time, bo_latency, bo_calls, bo_errors = api_get_paginated(
+        session, base_url, "backupObjects", token
     )
-    print(f"  {ok(f'Fetched {len(backup_objects)} backup objects in {bo_time:.0f}ms ({bo_calls} calls)')}")
-    timing.add("backupObjects (paginated)", bo_time, bo_calls)
+    mark = warn if bo_errors else ok
+    print(f"  {mark(f'Fetched {len(backup_objects)} backup objects in {bo_time:.0f}ms ({bo_calls} calls)')}")
+    print_page_errors(bo_errors)
+    timing.add("backupObjects (paginated)", bo_time, bo_calls, bo_latency)
 
     if not backup_objects:
         print(warn("No backup objects found - skipping performance test"))
@@ -622,63 +1131,69 @@ def run_performance_test(
     # Calculate time filter
     rp_params: Optional[Dict[str, str]] = None
     if restore_points_days > 0:
-        from datetime import datetime, timedelta, timezone
         created_after = (
             datetime.now(timezone.utc) - timedelta(days=restore_points_days)
         ).strftime("%Y-%m-%dT%H:%M:%SZ")
         rp_params = {"createdAfterFilter": created_after}
         print(f"  Filter: createdAfterFilter={created_after}")
 
-    all_rp, bulk_time, bulk_calls = api_get_paginated(
-        session, base_url, "restorePoints", token, verify_ssl, extra_params=rp_params
+    all_rp, bulk_time, bulk_latency, bulk_calls, rp_errors = api_get_paginated(
+        session, base_url, "restorePoints", token, extra_params=rp_params
     )
-    print(f"  {ok(f'Fetched {len(all_rp)} restore points in {bulk_time:.0f}ms ({bulk_calls} calls)')}")
-    timing.add(f"restorePoints BULK ({restore_points_days} days)", bulk_time, bulk_calls)
+    mark = warn if rp_errors else ok
+    print(f"  {mark(f'Fetched {len(all_rp)} restore points in {bulk_time:.0f}ms ({bulk_calls} calls)')}")
+    print_page_errors(rp_errors)
+    timing.add(f"restorePoints BULK ({restore_points_days} days)", bulk_time, bulk_calls, bulk_latency)
 
     # Test per-object restore points (limited to max_objects)
     print_subheader(f"Per-Object Restore Points (OLD - first {max_objects} objects)")
 
-    test_objects = backup_objects[:max_objects]
-    per_object_total = 0.0
+    object_ids = [obj.get("id") for obj in backup_objects[:max_objects] if obj.get("id")]
+    per_object_latency = 0.0
     per_object_count = 0
     per_object_rp_count = 0
 
-    for obj in test_objects:
-        object_id = obj.get("id")
-        if not object_id:
-            continue
-
-        try:
-            rp_data, rp_time = api_get(
-                session, base_url, f"backupObjects/{object_id}/restorePoints",
-                token, verify_ssl
-            )
-            per_object_total += rp_time
-            per_object_count += 1
-            if rp_data:
-                items = rp_data.get("data", []) if isinstance(rp_data, dict) else rp_data
-                per_object_rp_count += len(items) if isinstance(items, list) else 0
-        except Exception as e:
-            print(f"    {warn(f'Error for object {object_id}: {e}')}")
+    # Fetch all objects concurrently; wall-clock time reflects the concurrent cost
+    start = time.perf_counter_ns()
+    fetched = api_get_many(
+        session, base_url,
+        [f"backupObjects/{object_id}/restorePoints" for object_id in object_ids],
+        token,
+    )
+    per_object_total = elapsed_ms(start)
 
-    avg_per_call = per_object_total / per_object_count if per_object_count > 0 else 0
-    print(f"  Tested {per_object_count} objects: {per_object_total:.0f}ms total, {avg_per_call:.0f}ms avg/call")
+    for object_id, (rp_data, rp_time, error) in zip(object_ids, fetched):
+        if error is not None:
+            print(f"    {warn(f'Error for object {object_id}: {error}')}")
+            continue
+        per_object_latency += rp_time
+        per_object_count += 1
+        if rp_data:
+            items = rp_data.get("data", []) if isinstance(rp_data, dict) else rp_data
+            per_object_rp_count += len(items) if isinstance(items, list) else 0
+
+    # Average latency per call is what a sequential per-object agent would pay per object
+    avg_per_call = per_object_latency / per_object_count if per_object_count > 0 else 0
+    print(f"  Tested {per_object_count} objects: {per_object_total:.0f}ms total (concurrent), {avg_per_call:.0f}ms avg/call")
     print(f"  Found {per_object_rp_count} restore points for tested objects")
-    timing.add(f"restorePoints PER-OBJECT ({per_object_count} objects)", per_object_total, per_object_count)
+    timing.add(
+        f"restorePoints PER-OBJECT ({per_object_count} objects)", per_object_total, per_object_count, per_object_latency
+    )
 
-    # Extrapolation
-    print_subheader("Performance Comparison")
+    # Extrapolation; both sides are summed call latencies, as the special agent
+    # pages sequentially (this script's own concurrency is left out)
+    print_subheader("Performance Comparison (sequential, like the special agent)")
 
     total_objects = len(backup_objects)
     estimated_per_object = avg_per_call * total_objects
 
     print(f"\n  {Colors.BOLD}For {total_objects} backup objects:{Colors.END}")
-    print(f"    Bulk API (optimized):     {bulk_time:>8.0f}ms  ({bulk_calls} calls)")
+    print(f"    Bulk API (optimized):     {bulk_latency:>8.0f}ms  ({bulk_calls} calls)")
     print(f"    Per-Object (estimated):   {estimated_per_object:>8.0f}ms  ({total_objects} calls)")
 
     if estimated_per_object > 0:
-        speedup = estimated_per_object / bulk_time if bulk_time > 0 else 0
-        savings = estimated_per_object - bulk_time
+        speedup = estimated_per_object / bulk_latency if bulk_latency > 0 else 0
+        savings = estimated_per_object - bulk_latency
         print(f"\n  {Colors.GREEN}Bulk API is ~{speedup:.1f}x faster ({savings:.0f}ms saved){Colors.END}")
         print(f"  {Colors.GREEN}API calls reduced from {total_objects} to {bulk_calls}{Colors.END}")
 
@@ -689,6 +1204,8 @@ def run_performance_test(
 
 
 def main() -> int:
+    global MAX_CONCURRENCY, REDACT_ENABLED, redact
+
     parser = argparse.ArgumentParser(
         description="Debug Veeam REST API connection issues",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -725,29 +1242,74 @@ The password will be prompted securely (hidden input).
         default=7,
         help="Only fetch restore points from the last N days (default: 7, 0=all)",
     )
+    parser.add_argument(
+        "--reuse-token",
+        action="store_true",
+        help="Cache the OAuth2 token in ~/.cache/veeam_debug and reuse it until it expires",
+    )
+    parser.add_argument(
+        "--http-backend",
+        choices=["auto", "requests", "urllib3", "httpx"],
+        default="auto",
+        help="HTTP client for API calls; urllib3 skips the requests layer, "
+        "httpx uses HTTP/2 if h2 is installed but does not retry 502/503/504, "
+        "auto picks httpx when HTTP/2 is available and requests otherwise (default: auto)",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=5.0,
+        help="Timeout in seconds for the TCP port check (default: 5)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f"Maximum number of API requests in flight at once, 1 = sequential (default: {MAX_CONCURRENCY})",
+    )
 
     args = parser.parse_args()
 
+    if args.http_backend == "httpx" and httpx is None:
+        parser.error("--http-backend httpx requires the 'httpx' module (pip install httpx[http2])")
+    if args.http_backend == "auto":
+        # HTTP/2 multiplexes the concurrent API calls over one connection
+        args.http_backend = "httpx" if httpx is not None and HTTP2_AVAILABLE else "requests"
+
     # Prompt for password securely if not provided
     password = args.password
     if not password:
+        import getpass
+
         password = getpass.getpass(f"Password for {args.user}: ")
 
     if args.no_color or not sys.stdout.isatty():
         Colors.disable()
 
-    global REDACT_ENABLED, REDACT_VALUES
+    MAX_CONCURRENCY = max(1, args.max_concurrency)
     if args.redact:
         REDACT_ENABLED = True
-        REDACT_VALUES = [args.host, args.user, password]
+        for value in (args.host, args.user, password):
+            _add_redact(value)
+    else:
+        # Redaction is off for the whole run: skip the checks in every call
+        redact = _no_redact
 
     verify_ssl = not args.no_cert_check
-    base_url = f"https://{args.host}:{args.port}"
+    # IPv6 literals need brackets in URLs
+    url_host = f"[{args.host}]" if ":" in args.host else args.host
+    base_url = f"https://{url_host}:{args.port}"
 
-    session = requests.Session()
+    token_cache = token_cache_path(base_url, args.user) if args.reuse_token else None
+
+    session = build_session(verify_ssl, args.http_backend)
     results = TestResults()
     timing = TimingTracker()
 
+    # Host, user and base URL are redacted once up front and reused below
+    shown_base_url = redact(base_url)
+    shown_user = redact(args.user)
+
     # =========================================================================
     # HEADER: System Info
     # =========================================================================
@@ -755,8 +1317,11 @@ The password will be prompted securely (hidden input).
     print(f"  Timestamp: {datetime.now().isoformat()}")
     print(f"  Python: {sys.version.split()[0]}")
     print(f"  Requests: {REQUESTS_VERSION}")
-    print(f"  Target: {redact(base_url)}")
-    print(f"  User: {redact(args.user)}")
+    print(f"  httpx: {HTTPX_VERSION or 'not installed'}")
+    http2 = " (HTTP/2)" if args.http_backend == "httpx" and HTTP2_AVAILABLE else ""
+    print(f"  HTTP Backend: {args.http_backend}{http2}")
+    print(f"  Target: {shown_base_url}")
+    print(f"  User: {shown_user}")
     print(f"  API Version: {API_VERSION}")
     print(f"  SSL Verify: {verify_ssl}")
 
@@ -771,8 +1336,8 @@ The password will be prompted securely (hidden input).
         results.print_summary()
         return 1
 
-    tcp_ok = test_tcp_connection(resolved_ip, args.port, results)
-    if not tcp_ok:
+    tcp_sock = test_tcp_connection(resolved_ip, args.port, results, args.connect_timeout)
+    if tcp_sock is None:
         print(fail(f"\nCannot proceed - port {args.port} not reachable"))
         results.print_summary()
         return 1
@@ -781,7 +1346,8 @@ The password will be prompted securely (hidden input).
     # TEST 2: SSL/TLS
     # =========================================================================
     print_header("2. SSL/TLS CERTIFICATE")
-    test_ssl_certificate(resolved_ip, args.port, results)
+    # Handshake on the TCP test's connection instead of connecting again
+    test_ssl_certificate(tcp_sock, resolved_ip, results)
 
     # =========================================================================
     # TEST 3: Authentication
@@ -789,7 +1355,7 @@ The password will be prompted securely (hidden input).
     print_header("3. AUTHENTICATION")
 
     token = get_oauth_token(
-        session, base_url, args.user, password, verify_ssl, results, timing
+        session, base_url, args.user, password, results, timing, token_cache
     )
 
     if not token:
@@ -807,16 +1373,28 @@ The password will be prompted securely (hidden input).
     # =========================================================================
     print_header("4. SERVER INFORMATION")
 
-    server_info = test_api_endpoint(
-        session, base_url, "serverInfo", token, "Server Info",
-        results, "Server", verify_ssl, timing, show_data=True
+    fetched = fetch_api_endpoint(session, base_url, "serverInfo", token)
+
+    if getattr(fetched[0], "status_code", None) == 401 and token_cache and os.path.exists(token_cache):
+        # Cached token may have been revoked server-side: drop it and log in again
+        print(warn("Cached token rejected (HTTP 401), re-authenticating"))
+        invalidate_cached_token(token_cache)
+        results.discard("Auth", "OAuth2 Token")
+        token = get_oauth_token(
+            session, base_url, args.user, password, results, timing, token_cache
+        )
+        if token:
+            fetched = fetch_api_endpoint(session, base_url, "serverInfo", token)
+
+    server_info = report_api_endpoint(
+        fetched, base_url, "serverInfo", "Server Info", results, "Server", timing, show_data=True
     )
 
     if server_info:
         # Add server name to redact list
         server_name = server_info.get("name")
-        if REDACT_ENABLED and server_name and server_name not in REDACT_VALUES:
-            REDACT_VALUES.append(server_name)
+        if REDACT_ENABLED:
+            _add_redact(server_name)
         print(f"\n  {Colors.BOLD}Veeam Server Details:{Colors.END}")
         print(f"    Name: {redact(server_info.get('name', 'Unknown'))}")
         print(f"    Build: {server_info.get('buildVersion', 'Unknown')}")
@@ -832,14 +1410,14 @@ The password will be prompted securely (hidden input).
 
     license_info = test_api_endpoint(
         session, base_url, "license", token, "License Info",
-        results, "License", verify_ssl, timing, show_data=True
+        results, "License", timing, show_data=True
     )
 
     if license_info:
         # Add licensedTo to redact list
         licensed_to = license_info.get("licensedTo")
-        if REDACT_ENABLED and licensed_to and licensed_to not in REDACT_VALUES:
-            REDACT_VALUES.append(licensed_to)
+        if REDACT_ENABLED:
+            _add_redact(licensed_to)
         print(f"\n  {Colors.BOLD}License Details:{Colors.END}")
         print(f"    Status: {license_info.get('status', 'Unknown')}")
         print(f"    Type: {license_info.get('type', 'Unknown')}")
@@ -859,75 +1437,71 @@ The password will be prompted securely (hidden input).
     # =========================================================================
     print_header("6. REST API ENDPOINTS")
 
-    print_subheader("Core Endpoints")
-    core_endpoints = [
-        ("jobs/states", "Job States"),
-        ("backups", "Backups"),
-        ("backupObjects", "Backup Objects"),
-        ("taskSessions", "Task Sessions"),
-        ("restorePoints", "Restore Points (Bulk)"),
-    ]
-    for endpoint, name in core_endpoints:
-        data = test_api_endpoint(
-            session, base_url, endpoint, token, name,
-            results, "API", verify_ssl, timing
-        )
-        if data and isinstance(data, dict) and "data" in data:
-            print(f"    Found: {len(data['data'])} items")
-        elif data and isinstance(data, list):
-            print(f"    Found: {len(data)} items")
-
-    print_subheader("Infrastructure Endpoints")
-    infra_endpoints = [
-        ("backupInfrastructure/repositories/states", "Repositories"),
-        ("backupInfrastructure/proxies/states", "Proxies"),
-        ("backupInfrastructure/managedServers", "Managed Servers"),
-        ("backupInfrastructure/scaleOutRepositories", "Scale-Out Repositories"),
-        ("backupInfrastructure/wanAccelerators", "WAN Accelerators"),
-        ("replicas", "Replicas"),
+    # Responses of TEST 6, reused by TEST 7 instead of fetching them again
+    endpoint_cache: Dict[str, Any] = {}
+
+    endpoint_groups = [
+        ("Core Endpoints", "API", False, [
+            ("jobs/states", "Job States"),
+            ("backups", "Backups"),
+            ("backupObjects", "Backup Objects"),
+            ("taskSessions", "Task Sessions"),
+            ("restorePoints", "Restore Points (Bulk)"),
+        ]),
+        ("Infrastructure Endpoints", "Infrastructure", False, [
+            ("backupInfrastructure/repositories/states", "Repositories"),
+            ("backupInfrastructure/proxies/states", "Proxies"),
+            ("backupInfrastructure/managedServers", "Managed Servers"),
+            ("backupInfrastructure/scaleOutRepositories", "Scale-Out Repositories"),
+            ("backupInfrastructure/wanAccelerators", "WAN Accelerators"),
+            ("replicas", "Replicas"),
+        ]),
+        ("Configuration & Security Endpoints", "Config/Security", True, [
+            ("configBackup", "Configuration Backup"),
+            ("securityAnalyzer/bestPractices", "Security Best Practices"),
+        ]),
     ]
-    for endpoint, name in infra_endpoints:
-        data = test_api_endpoint(
-            session, base_url, endpoint, token, name,
-            results, "Infrastructure", verify_ssl, timing
-        )
-        if data and isinstance(data, dict) and "data" in data:
-            print(f"    Found: {len(data['data'])} items")
-        elif data and isinstance(data, list):
-            print(f"    Found: {len(data)} items")
-
-    print_subheader("Configuration & Security Endpoints")
-    config_endpoints = [
-        ("configBackup", "Configuration Backup"),
-        ("securityAnalyzer/bestPractices", "Security Best Practices"),
-    ]
-    for endpoint, name in config_endpoints:
-        data = test_api_endpoint(
-            session, base_url, endpoint, token, name,
-            results, "Config/Security", verify_ssl, timing, show_data=True
-        )
-        if data and isinstance(data, dict) and "data" in data:
-            print(f"    Found: {len(data['data'])} items")
-        elif data and isinstance(data, list):
-            print(f"    Found: {len(data)} items")
+
+    # All groups are independent: send every request in one concurrent batch,
+    # then report group by group
+    fetched_all = fetch_api_endpoints(
+        session, base_url, [endpoint for *_, endpoints in endpoint_groups for endpoint, _ in endpoints], token
+    )
+    offset = 0
+    for title, category, show_data, endpoints in endpoint_groups:
+        print_subheader(title)
+        fetched = fetched_all[offset:offset + len(endpoints)]
+        offset += len(endpoints)
+        for data in test_api_endpoints(
+            session, base_url, endpoints, token, results, category, timing,
+            show_data=show_data, cache=endpoint_cache, fetched=fetched,
+        ):
+            if data and isinstance(data, dict) and "data" in data:
+                print(f"    Found: {len(data['data'])} items")
+            elif data and isinstance(data, list):
+                print(f"    Found: {len(data)} items")
 
     # =========================================================================
     # TEST 7: Data Summary
     # =========================================================================
     print_header("7. DATA SUMMARY")
 
-    # Get jobs
-    jobs_data, _ = api_get(session, base_url, "jobs/states", token, verify_ssl)
+    # Reuse TEST 6 responses; fetch whatever failed there in one concurrent batch
+    summary_endpoints = ["jobs/states", "backupInfrastructure/repositories/states", "backupObjects", "restorePoints"]
+    missing = [endpoint for endpoint in summary_endpoints if endpoint not in endpoint_cache]
+    for endpoint, (data, _, _) in zip(missing, api_get_many(session, base_url, missing, token)):
+        endpoint_cache[endpoint] = data
+    jobs_data, repos_data, bo_data, rp_data = (endpoint_cache[endpoint] for endpoint in summary_endpoints)
+
+    # Jobs
     if jobs_data:
         jobs = jobs_data.get("data", []) if isinstance(jobs_data, dict) else jobs_data
         # Add job names to redact list
         if REDACT_ENABLED:
             for job in jobs:
-                job_name = job.get("name")
-                if job_name and job_name not in REDACT_VALUES:
-                    REDACT_VALUES.append(job_name)
+                _add_redact(job.get("name"))
         print(f"\n  {Colors.BOLD}Jobs ({len(jobs)}):{Colors.END}")
-        for job in jobs[:10]:
+        for job in islice(jobs, 10):
             job_name = job.get("name", "Unknown")
             job_type = job.get("type", "Unknown")
             status = job.get("status", "Unknown")
@@ -936,18 +1510,15 @@ The password will be prompted securely (hidden input).
         if len(jobs) > 10:
             print(f"    ... and {len(jobs) - 10} more")
 
-    # Get repositories
-    repos_data, _ = api_get(session, base_url, "backupInfrastructure/repositories/states", token, verify_ssl)
+    # Repositories
     if repos_data:
         repos = repos_data.get("data", []) if isinstance(repos_data, dict) else repos_data
         # Add repository names to redact list
         if REDACT_ENABLED:
             for repo in repos:
-                repo_name = repo.get("name")
-                if repo_name and repo_name not in REDACT_VALUES:
-                    REDACT_VALUES.append(repo_name)
+                _add_redact(repo.get("name"))
         print(f"\n  {Colors.BOLD}Repositories ({len(repos)}):{Colors.END}")
-        for repo in repos[:10]:
+        for repo in islice(repos, 10):
             repo_name = repo.get("name", "Unknown")
             repo_type = repo.get("type", "Unknown")
             capacity = repo.get("capacityGB", 0)
@@ -957,32 +1528,24 @@ The password will be prompted securely (hidden input).
         if len(repos) > 10:
             print(f"    ... and {len(repos) - 10} more")
 
-    # Get backup objects count
-    bo_data, _ = api_get(session, base_url, "backupObjects", token, verify_ssl)
+    # Backup objects count
     if bo_data:
         backup_objects = bo_data.get("data", []) if isinstance(bo_data, dict) else bo_data
         print(f"\n  {Colors.BOLD}Backup Objects ({len(backup_objects)}):{Colors.END}")
         # Group by platform
-        by_platform: Dict[str, int] = {}
-        for obj in backup_objects:
-            platform = obj.get("platformName", "Unknown")
-            by_platform[platform] = by_platform.get(platform, 0) + 1
-        for platform, count in sorted(by_platform.items(), key=lambda x: -x[1]):
+        by_platform = Counter(obj.get("platformName", "Unknown") for obj in backup_objects)
+        for platform, count in by_platform.most_common():
             print(f"    - {platform}: {count} objects")
 
-    # Get restore points count
-    rp_data, _ = api_get(session, base_url, "restorePoints", token, verify_ssl)
+    # Restore points count
     if rp_data:
         restore_points = rp_data.get("data", []) if isinstance(rp_data, dict) else rp_data
         print(f"\n  {Colors.BOLD}Restore Points ({len(restore_points)}):{Colors.END}")
         # Count by malware status
-        malware_stats: Dict[str, int] = {}
-        for rp in restore_points:
-            status = rp.get("malwareStatus", "Unknown")
-            malware_stats[status] = malware_stats.get(status, 0) + 1
+        malware_stats = Counter(rp.get("malwareStatus", "Unknown") for rp in restore_points)
         if malware_stats:
             print("    Malware Status:")
-            for status, count in sorted(malware_stats.items(), key=lambda x: -x[1]):
+            for status, count in malware_stats.most_common():
                 print(f"      - {status}: {count}")
 
     # =========================================================================
@@ -1016,17 +1579,18 @@ The password will be prompted securely (hidden input).
         print_subheader("Task Sessions (Warning Detection)")
 
         # Fetch with 24h filter
-        from datetime import timedelta, timezone
         created_after_24h = (
             datetime.now(timezone.utc) - timedelta(hours=24)
         ).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        tasks_filtered, task_time, task_calls = api_get_paginated(
-            session, base_url, "taskSessions", token, verify_ssl,
+        tasks_filtered, task_time, task_latency, task_calls, task_errors = api_get_paginated(
+            session, base_url, "taskSessions", token,
             extra_params={"createdAfterFilter": created_after_24h}
         )
-        print(f"  {ok(f'Fetched {len(tasks_filtered)} task sessions (24h filter) in {task_time:.0f}ms')}")
-        timing.add("taskSessions (24h filter)", task_time, task_calls)
+        mark = warn if task_errors else ok
+        print(f"  {mark(f'Fetched {len(tasks_filtered)} task sessions (24h filter) in {task_time:.0f}ms')}")
+        print_page_errors(task_errors)
+        timing.add("taskSessions (24h filter)", task_time, task_calls, task_latency)
 
         # Check for VMs with Warning/Failed results in warning sessions
         warning_session_ids = {j["sessionId"] for j in warning_jobs if j.get("sessionId")}
@@ -1035,18 +1599,19 @@ The password will be prompted securely (hidden input).
         for task in tasks_filtered:
             if task.get("sessionId") not in warning_session_ids:
                 continue
-            task_result = task.get("result", {}).get("result")
+            result_info = task.get("result") or {}
+            task_result = result_info.get("result")
             if task_result in ("Warning", "Failed"):
                 vms_with_issues.append({
                     "name": task.get("name"),
                     "result": task_result,
-                    "message": task.get("result", {}).get("message", ""),
+                    "message": result_info.get("message") or "",
                     "sessionId": task.get("sessionId"),
                 })
 
         if vms_with_issues:
             print(f"\n  {Colors.BOLD}VMs with Warning/Failed task results:{Colors.END}")
-            for vm in vms_with_issues[:20]:
+            for vm in islice(vms_with_issues, 20):
                 status_color = Colors.RED if vm["result"] == "Failed" else Colors.YELLOW
                 print(f"    {status_color}[{vm['result']}]{Colors.END} {redact(vm['name'])}")
                 if vm["message"]:
@@ -1061,9 +1626,15 @@ The password will be prompted securely (hidden input).
     # =========================================================================
     print_header("9. CONFIGURATION & SECURITY STATUS")
 
+    # Reuse TEST 6 responses; fetch whatever failed there in one concurrent batch
+    status_endpoints = ["configBackup", "securityAnalyzer/bestPractices"]
+    missing = [endpoint for endpoint in status_endpoints if endpoint not in endpoint_cache]
+    for endpoint, (data, _, _) in zip(missing, api_get_many(session, base_url, missing, token)):
+        endpoint_cache[endpoint] = data
+    config_backup_data, security_data = (endpoint_cache[endpoint] for endpoint in status_endpoints)
+
     # Configuration Backup
     print_subheader("Configuration Backup")
-    config_backup_data, _ = api_get(session, base_url, "configBackup", token, verify_ssl)
     if config_backup_data:
         is_enabled = config_backup_data.get("isEnabled", False)
         if is_enabled:
@@ -1089,7 +1660,6 @@ The password will be prompted securely (hidden input).
 
     # Security Best Practices
     print_subheader("Security Best Practices")
-    security_data, sec_time = api_get(session, base_url, "securityAnalyzer/bestPractices", token, verify_ssl)
     if security_data:
         checks = security_data.get("data", []) if isinstance(security_data, dict) else security_data
         if isinstance(checks, list):
@@ -1122,7 +1692,7 @@ The password will be prompted securely (hidden input).
     # TEST 10: Performance Test (Bulk vs Per-Object API Calls)
     # =========================================================================
     run_performance_test(
-        session, base_url, token, verify_ssl, timing,
+        session, base_url, token, timing,
         args.perf_objects, args.restore_points_days
     )
 
@@ -1137,15 +1707,21 @@ The password will be prompted securely (hidden input).
     recommendations = []
     issues_found = False
 
+    # Tally all results once: status counts per category, failed endpoint names
+    status_counts: Dict[str, Counter] = defaultdict(Counter)
+    failed_endpoints = []
+    for category, test_name, status in results.results:
+        status_counts[category][status] += 1
+        if status == "FAIL" and category in ("API", "Infrastructure"):
+            failed_endpoints.append(test_name)
+
     # Check network issues
-    network_results = [r for r in results.results if r[0] == "Network"]
-    if any(r[2] == "FAIL" for r in network_results):
+    if status_counts["Network"]["FAIL"]:
         issues_found = True
         recommendations.append("- Network connectivity issues detected - check firewall and DNS")
 
     # Check auth issues
-    auth_results = [r for r in results.results if r[0] == "Auth"]
-    if any(r[2] == "FAIL" for r in auth_results):
+    if status_counts["Auth"]["FAIL"]:
         issues_found = True
         recommendations.append("- Authentication failed:")
         recommendations.append("  - Check username format (DOMAIN\\user or user@domain.com)")
@@ -1154,30 +1730,32 @@ The password will be prompted securely (hidden input).
         recommendations.append("  - Check if Veeam REST API service is running")
 
     # Check API issues
-    api_results = [r for r in results.results if r[0] in ["API", "Infrastructure"]]
-    api_ok = all(r[2] == "PASS" for r in api_results)
+    api_ok = not any(
+        status_counts[category][status] for category in ("API", "Infrastructure") for status in ("FAIL", "WARN")
+    )
 
     if api_ok:
         recommendations.append("- REST API: All endpoints responding correctly")
     else:
-        failed_endpoints = [r[1] for r in api_results if r[2] == "FAIL"]
         if failed_endpoints:
             issues_found = True
             recommendations.append(f"- REST API: Some endpoints failed: {', '.join(failed_endpoints)}")
 
     # Check license
-    license_results = [r for r in results.results if r[0] == "License"]
-    if any(r[2] == "PASS" for r in license_results):
+    if status_counts["License"]["PASS"]:
         recommendations.append("- License: Information retrieved successfully")
     else:
         issues_found = True
         recommendations.append("- License: Could not retrieve license information")
 
     # Check timing
-    total_api_time = sum(t[1] for t in timing.timings)
+    total_api_time = timing.get_total_api_time()
     if total_api_time > 30000:
         issues_found = True
-        recommendations.append(f"- Performance: API calls take {total_api_time/1000:.1f}s - may cause timeouts")
+        recommendations.append(
+            f"- Performance: API calls take {total_api_time/1000:.1f}s when made one after another "
+            "like the special agent does - may cause timeouts"
+        )
         recommendations.append("  - Consider enabling section caching in the special agent")
         recommendations.append("  - Reduce session_age to limit historical data")
 
@@ -7,6 +7,7 @@ directly on the Veeam server. Alternative to piggyback mode.
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -59,11 +60,11 @@ def discover_veeam_rest_backup_objects(section: Section) -> DiscoveryResult:
 # =============================================================================
 
 # Backup object type display names
-TYPE_DISPLAY = {
+TYPE_DISPLAY = MappingProxyType({
     "VirtualMachine": "VM",
     "Computer": "Agent",
     "VCloud": "vCloud",
-}
+})
 
 
 def check_veeam_rest_backup_objects(
@@ -98,15 +99,15 @@ def check_veeam_rest_backup_objects(
     platform = obj.get("platformName", "")
     job_name = obj.get("jobName")
 
-    summary = f"{result_text}"
+    parts = [result_text]
     if job_name:
-        summary += f", Job: {job_name}"
-    summary += f", Type: {type_display}"
+        parts.append(f", Job: {job_name}")
+    parts.append(f", Type: {type_display}")
     if platform:
-        summary += f" ({platform})"
-    summary += f", Restore points: {restore_point_count}"
+        parts.append(f" ({platform})")
+    parts.append(f", Restore points: {restore_point_count}")
 
-    yield Result(state=result_state, summary=summary)
+    yield Result(state=result_state, summary="".join(parts))
 
     # Yield common backup metrics and checks (restore points, age, task data, malware, etc.)
     yield from yield_backup_metrics(obj, params, restore_point_count, include_extra_metrics=True)
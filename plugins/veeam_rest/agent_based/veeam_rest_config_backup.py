@@ -5,7 +5,6 @@ Check plugin for Veeam Configuration Backup.
 Monitors configuration backup status - critical for disaster recovery.
 """
 
-import json
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any
@@ -15,7 +14,6 @@ from cmk.agent_based.v2 import (
     CheckPlugin,
     CheckResult,
     DiscoveryResult,
-    Metric,
     Result,
     Service,
     State,
@@ -24,6 +22,8 @@ from cmk.agent_based.v2 import (
     render,
 )
 
+from cmk_addons.plugins.veeam_rest.lib import parse_json_section
+
 
 # =============================================================================
 # SECTION PARSING
@@ -34,14 +34,10 @@ Section = dict[str, Any]
 
 def parse_veeam_rest_config_backup(string_table: StringTable) -> Section | None:
     """Parse JSON output from special agent."""
-    if not string_table:
-        return None
-
-    try:
-        json_str = "".join(line[0] for line in string_table)
-        return json.loads(json_str)
-    except (json.JSONDecodeError, IndexError):
+    data = parse_json_section(string_table)
+    if not isinstance(data, dict):
         return None
+    return data
 
 
 agent_section_veeam_rest_config_backup = AgentSection(
@@ -69,7 +65,7 @@ def _parse_datetime(date_str: str | None) -> datetime | None:
     if not date_str:
         return None
     try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return datetime.fromisoformat(date_str)
     except (ValueError, TypeError):
         return None
 
@@ -7,6 +7,7 @@ Monitors backup and replication job status, last result, and schedule.
 
 from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -40,8 +41,8 @@ def _get_job_item(job: dict[str, Any]) -> str | None:
     name = job.get("name")
     if not name:
         return None
-    category = _get_job_category(job)
-    return f"{category} - {name}"
+    job_type = job.get("type", "Unknown")
+    return f"{JOB_TYPE_CATEGORY.get(job_type, job_type)} - {name}"
 
 
 def parse_veeam_rest_jobs(string_table) -> Section | None:
@@ -49,12 +50,7 @@ def parse_veeam_rest_jobs(string_table) -> Section | None:
     data = parse_json_section(string_table)
     if not data or not isinstance(data, list):
         return None
-    result = {}
-    for job in data:
-        item = _get_job_item(job)
-        if item:
-            result[item] = job
-    return result or None
+    return {item: job for job in data if (item := _get_job_item(job))} or None
 
 
 agent_section_veeam_rest_jobs = AgentSection(
@@ -105,12 +101,6 @@ JOB_TYPE_CATEGORY = {
 }
 
 
-def _get_job_category(job: dict[str, Any]) -> str:
-    """Determine the job category for service naming."""
-    job_type = job.get("type", "Unknown")
-    return JOB_TYPE_CATEGORY.get(job_type, job_type)
-
-
 # =============================================================================
 # DISCOVERY
 # =============================================================================
@@ -166,12 +156,16 @@ STATE_MAP = {
 }
 
 
+@lru_cache(maxsize=1024)
 def _format_datetime(iso_string: str | None) -> str | None:
-    """Format ISO 8601 datetime to readable format (DD.MM.YYYY HH:MM:SS)."""
+    """Format ISO 8601 datetime to readable format (DD.MM.YYYY HH:MM:SS).
+
+    Cached: jobs on a shared schedule report the same lastRun/nextRun strings.
+    """
     if not iso_string:
         return None
     try:
-        dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(iso_string)
         return dt.strftime("%d.%m.%Y %H:%M:%S")
     except (ValueError, TypeError):
         return iso_string  # Return original if parsing fails
@@ -209,9 +203,15 @@ def check_veeam_rest_jobs(
         yield Result(state=State.UNKNOWN, summary="Job not found")
         return
 
+    status = job.get("status", "Unknown")
+
+    # Check if job is disabled and ignore_disabled is set
+    if status == "Disabled" and params.get("ignore_disabled", False):
+        yield Result(state=State.OK, summary="Job is disabled (ignored)")
+        return
+
     # Extract job properties
     job_type = job.get("type", "Unknown")
-    status = job.get("status", "Unknown")
     last_result = job.get("lastResult", "None")
     last_run = job.get("lastRun")
     next_run = job.get("nextRun")
@@ -220,6 +220,15 @@ def check_veeam_rest_jobs(
     repository = job.get("repositoryName", "")
     last_run_age = job.get("lastRunAgeSeconds")
 
+    # Session progress of the last run, read once for summary, details and metrics
+    session_progress = job.get("sessionProgress") or {}
+    duration = session_progress.get("duration", "")
+    bottleneck = session_progress.get("bottleneck", "")
+    processed_size = session_progress.get("processedSize", 0)
+    read_size = session_progress.get("readSize", 0)
+    transferred_size = session_progress.get("transferredSize", 0)
+    processing_rate = session_progress.get("processingRate", "")
+
     # Determine state based on last result (configurable)
     result_state = _get_result_state(last_result, params)
 
@@ -229,11 +238,6 @@ def check_veeam_rest_jobs(
     # Use the worst state between result and status
     state = State.worst(result_state, status_state)
 
-    # Check if job is disabled and ignore_disabled is set
-    if status == "Disabled" and params.get("ignore_disabled", False):
-        yield Result(state=State.OK, summary="Job is disabled (ignored)")
-        return
-
     # Build summary
     status_text = JOB_STATUS_MAP.get(status, status)
     summary_parts = [f"Status: {status_text}", f"Last result: {last_result}"]
@@ -243,10 +247,6 @@ def check_veeam_rest_jobs(
         summary_parts.append(f"Progress: {progress}%")
     else:
         # Add duration and processed size for completed jobs
-        session_progress = job.get("sessionProgress", {}) or {}
-        duration = session_progress.get("duration", "")
-        processed_size = session_progress.get("processedSize", 0)
-
         if duration:
             summary_parts.append(f"Last Duration: {duration}")
         if processed_size and processed_size > 0:
@@ -272,61 +272,51 @@ def check_veeam_rest_jobs(
     is_storage_snapshot = job.get("isStorageSnapshot", False)
     backup_server = job.get("backupServer", "")
     next_run_policy = job.get("nextRunPolicy", "")
-    session_progress = job.get("sessionProgress", {})
-
-    # Session progress details
-    duration = session_progress.get("duration", "")
-    bottleneck = session_progress.get("bottleneck", "")
-    processed_size = session_progress.get("processedSize", 0)
-    read_size = session_progress.get("readSize", 0)
-    transferred_size = session_progress.get("transferredSize", 0)
-    processing_rate = session_progress.get("processingRate", "")
 
-    # Details section
-    yield Result(state=State.OK, notice=f"Type: {job_type}")
-    yield Result(state=State.OK, notice=f"Objects: {objects_count}")
+    # Details section, yielded as one multiline notice
+    details = [f"Type: {job_type}", f"Objects: {objects_count}"]
 
     if repository:
-        yield Result(state=State.OK, notice=f"Repository: {repository}")
+        details.append(f"Repository: {repository}")
 
     if description:
-        yield Result(state=State.OK, notice=f"Description: {description}")
+        details.append(f"Description: {description}")
 
     if workload:
-        yield Result(state=State.OK, notice=f"Workload: {workload}")
+        details.append(f"Workload: {workload}")
 
     if backup_server:
-        yield Result(state=State.OK, notice=f"Backup Server: {backup_server}")
+        details.append(f"Backup Server: {backup_server}")
 
     if last_run:
         last_run_formatted = _format_datetime(last_run) or last_run
-        yield Result(state=State.OK, notice=f"Last Run: {last_run_formatted}")
+        details.append(f"Last Run: {last_run_formatted}")
 
     if next_run:
         next_run_formatted = _format_datetime(next_run) or next_run
-        yield Result(state=State.OK, notice=f"Next Run: {next_run_formatted}")
+        details.append(f"Next Run: {next_run_formatted}")
 
     if next_run_policy and next_run_policy != "<Not scheduled>":
-        yield Result(state=State.OK, notice=f"Schedule Policy: {next_run_policy}")
+        details.append(f"Schedule Policy: {next_run_policy}")
 
     # Session progress details
     if duration:
-        yield Result(state=State.OK, notice=f"Last Duration: {duration}")
+        details.append(f"Last Duration: {duration}")
 
     if processed_size > 0:
-        yield Result(state=State.OK, notice=f"Processed: {render.disksize(processed_size)}")
+        details.append(f"Processed: {render.disksize(processed_size)}")
 
     if read_size > 0:
-        yield Result(state=State.OK, notice=f"Read: {render.disksize(read_size)}")
+        details.append(f"Read: {render.disksize(read_size)}")
 
     if transferred_size > 0:
-        yield Result(state=State.OK, notice=f"Transferred: {render.disksize(transferred_size)}")
+        details.append(f"Transferred: {render.disksize(transferred_size)}")
 
     if processing_rate:
-        yield Result(state=State.OK, notice=f"Speed: {processing_rate}")
+        details.append(f"Speed: {processing_rate}")
 
     if bottleneck and bottleneck not in ("NotDefined", "Unknown"):
-        yield Result(state=State.OK, notice=f"Bottleneck: {bottleneck}")
+        details.append(f"Bottleneck: {bottleneck}")
 
     # Flags
     flags = []
@@ -335,21 +325,22 @@ def check_veeam_rest_jobs(
     if is_storage_snapshot:
         flags.append("Storage Snapshot")
     if flags:
-        yield Result(state=State.OK, notice=f"Flags: {', '.join(flags)}")
+        details.append(f"Flags: {', '.join(flags)}")
+
+    yield Result(state=State.OK, notice="\n".join(details))
 
     # Metrics for graphing
     duration_seconds = parse_duration_to_seconds(duration)
     if duration_seconds is not None:
         yield Metric("veeam_rest_job_duration", duration_seconds)
 
-    if processed_size and processed_size > 0:
-        yield Metric("veeam_rest_job_size_processed", processed_size)
-
-    if read_size and read_size > 0:
-        yield Metric("veeam_rest_job_size_read", read_size)
-
-    if transferred_size and transferred_size > 0:
-        yield Metric("veeam_rest_job_size_transferred", transferred_size)
+    for metric_name, size in (
+        ("veeam_rest_job_size_processed", processed_size),
+        ("veeam_rest_job_size_read", read_size),
+        ("veeam_rest_job_size_transferred", transferred_size),
+    ):
+        if size and size > 0:
+            yield Metric(metric_name, size)
 
     speed_bytes = parse_rate_to_bytes_per_second(processing_rate)
     if speed_bytes is not None:
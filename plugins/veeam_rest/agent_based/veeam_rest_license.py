@@ -5,9 +5,9 @@ Check plugin for Veeam Backup License.
 Monitors license status, expiration, and usage.
 """
 
-import json
 from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -20,10 +20,10 @@ from cmk.agent_based.v2 import (
     Service,
     State,
     StringTable,
-    check_levels,
-    render,
 )
 
+from cmk_addons.plugins.veeam_rest.lib import parse_json_section
+
 
 # =============================================================================
 # SECTION PARSING
@@ -34,14 +34,10 @@ Section = dict[str, Any]
 
 def parse_veeam_rest_license(string_table: StringTable) -> Section | None:
     """Parse JSON output from special agent."""
-    if not string_table:
-        return None
-
-    try:
-        json_str = "".join(line[0] for line in string_table)
-        return json.loads(json_str)
-    except (json.JSONDecodeError, IndexError):
+    data = parse_json_section(string_table)
+    if not isinstance(data, dict):
         return None
+    return data
 
 
 agent_section_veeam_rest_license = AgentSection(
@@ -69,30 +65,59 @@ def _parse_datetime(date_str: str | None) -> datetime | None:
     if not date_str:
         return None
     try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return datetime.fromisoformat(date_str)
     except (ValueError, TypeError):
         return None
 
 
-def _days_until(target_date: datetime | None) -> int | None:
-    """Calculate days until a target date."""
+def _days_until(target_date: datetime | None, now: datetime) -> int | None:
+    """Calculate days from now until a target date."""
     if not target_date:
         return None
-    now = datetime.now(timezone.utc)
     delta = target_date - now
     return delta.days
 
 
+def _check_days_left(
+    label: str,
+    days_left: int,
+    warn: int,
+    crit: int,
+    crit_state: State,
+) -> CheckResult:
+    """Yield the expiration result for label; crit_state applies once expired or below crit."""
+    threshold_info = f"(warn/crit below {warn}/{crit} days)"
+    if days_left < 0:
+        state, text = crit_state, f"{label} expired {abs(days_left)} days ago"
+    elif days_left <= crit:
+        state, text = crit_state, f"{label} expires in {days_left} days"
+    elif days_left <= warn:
+        state, text = State.WARN, f"{label} expires in {days_left} days"
+    else:
+        state, text = State.OK, f"{label} expires in {days_left} days"
+    yield Result(state=state, summary=f"{text} {threshold_info}")
+
+
 # =============================================================================
 # CHECK FUNCTION
 # =============================================================================
 
+# Default check parameters, also the fallbacks for missing keys in params
+DEFAULT_LICENSE_PARAMETERS = {
+    "license_expiration_warn": 30,  # days
+    "license_expiration_crit": 7,   # days
+    "support_expiration_warn": 30,  # days
+    "support_expiration_crit": 7,   # days
+    "instance_usage_warn": 80.0,    # percent
+    "instance_usage_crit": 95.0,    # percent
+}
+
 # Status mapping
-STATUS_STATE_MAP = {
+STATUS_STATE_MAP = MappingProxyType({
     "Valid": State.OK,
     "Invalid": State.CRIT,
     "Expired": State.CRIT,
-}
+})
 
 
 def check_veeam_rest_license(
@@ -120,6 +145,12 @@ def check_veeam_rest_license(
     socket_summary = section.get("socketLicenseSummary", {})
     capacity_summary = section.get("capacityLicenseSummary", {})
 
+    # Thresholds with defaults filled in for keys missing from params
+    levels = {**DEFAULT_LICENSE_PARAMETERS, **params}
+
+    # Read the clock once for both expiration checks
+    now = datetime.now(timezone.utc)
+
     # Check license status
     state = STATUS_STATE_MAP.get(status, State.UNKNOWN)
     yield Result(state=state, summary=f"License status: {status}")
@@ -127,63 +158,30 @@ def check_veeam_rest_license(
     # Check license expiration
     exp_date = _parse_datetime(expiration_date)
     if exp_date:
-        days_left = _days_until(exp_date)
+        days_left = _days_until(exp_date, now)
         if days_left is not None:
-            exp_warn = params.get("license_expiration_warn", 30)
-            exp_crit = params.get("license_expiration_crit", 7)
-
-            threshold_info = f"(warn/crit below {exp_warn}/{exp_crit} days)"
-            if days_left < 0:
-                yield Result(
-                    state=State.CRIT,
-                    summary=f"License expired {abs(days_left)} days ago {threshold_info}",
-                )
-            elif days_left <= exp_crit:
-                yield Result(
-                    state=State.CRIT,
-                    summary=f"License expires in {days_left} days {threshold_info}",
-                )
-            elif days_left <= exp_warn:
-                yield Result(
-                    state=State.WARN,
-                    summary=f"License expires in {days_left} days {threshold_info}",
-                )
-            else:
-                yield Result(
-                    state=State.OK,
-                    summary=f"License expires in {days_left} days {threshold_info}",
-                )
+            yield from _check_days_left(
+                "License",
+                days_left,
+                levels["license_expiration_warn"],
+                levels["license_expiration_crit"],
+                State.CRIT,
+            )
             yield Metric("veeam_rest_license_days_remaining", days_left)
 
     # Check support expiration
     support_exp_date = _parse_datetime(support_expiration_date)
     if support_exp_date:
-        support_days_left = _days_until(support_exp_date)
+        support_days_left = _days_until(support_exp_date, now)
         if support_days_left is not None:
-            support_exp_warn = params.get("support_expiration_warn", 30)
-            support_exp_crit = params.get("support_expiration_crit", 7)
-
-            support_threshold_info = f"(warn/crit below {support_exp_warn}/{support_exp_crit} days)"
-            if support_days_left < 0:
-                yield Result(
-                    state=State.WARN,
-                    summary=f"Support contract expired {abs(support_days_left)} days ago {support_threshold_info}",
-                )
-            elif support_days_left <= support_exp_crit:
-                yield Result(
-                    state=State.WARN,
-                    summary=f"Support contract expires in {support_days_left} days {support_threshold_info}",
-                )
-            elif support_days_left <= support_exp_warn:
-                yield Result(
-                    state=State.WARN,
-                    summary=f"Support contract expires in {support_days_left} days {support_threshold_info}",
-                )
-            else:
-                yield Result(
-                    state=State.OK,
-                    summary=f"Support contract expires in {support_days_left} days {support_threshold_info}",
-                )
+            # An expired support contract is only a warning
+            yield from _check_days_left(
+                "Support contract",
+                support_days_left,
+                levels["support_expiration_warn"],
+                levels["support_expiration_crit"],
+                State.WARN,
+            )
             yield Metric("veeam_rest_support_days_remaining", support_days_left)
 
     # Check instance license usage
@@ -193,8 +191,8 @@ def check_veeam_rest_license(
 
         if licensed > 0:
             usage_percent = (used / licensed) * 100
-            usage_warn = params.get("instance_usage_warn", 80.0)
-            usage_crit = params.get("instance_usage_crit", 95.0)
+            usage_warn = levels["instance_usage_warn"]
+            usage_crit = levels["instance_usage_crit"]
 
             usage_threshold_info = f"(warn/crit at {usage_warn:.0f}/{usage_crit:.0f}%)"
             if usage_percent >= usage_crit:
@@ -267,13 +265,6 @@ check_plugin_veeam_rest_license = CheckPlugin(
     service_name="Veeam License",
     discovery_function=discover_veeam_rest_license,
     check_function=check_veeam_rest_license,
-    check_default_parameters={
-        "license_expiration_warn": 30,  # days
-        "license_expiration_crit": 7,   # days
-        "support_expiration_warn": 30,  # days
-        "support_expiration_crit": 7,   # days
-        "instance_usage_warn": 80.0,    # percent
-        "instance_usage_crit": 95.0,    # percent
-    },
+    check_default_parameters=DEFAULT_LICENSE_PARAMETERS,
     check_ruleset_name="veeam_rest_license",
 )
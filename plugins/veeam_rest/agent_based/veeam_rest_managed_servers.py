@@ -6,6 +6,7 @@ Monitors managed server status (vCenter, ESXi, Hyper-V hosts, etc.).
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -59,7 +60,7 @@ def discover_veeam_rest_managed_servers(section: Section) -> DiscoveryResult:
 # CHECK FUNCTION
 # =============================================================================
 
-SERVER_TYPE_MAP = {
+SERVER_TYPE_MAP = MappingProxyType({
     "WindowsHost": "Windows Host",
     "LinuxHost": "Linux Host",
     "ViHost": "VMware vSphere",
@@ -69,16 +70,16 @@ SERVER_TYPE_MAP = {
     "SCVMM": "System Center VMM",
     "SmbV3Cluster": "SMB Cluster",
     "SmbV3StandaloneHost": "SMB Host",
-}
+})
 
 # Status values that indicate problems
-PROBLEM_STATUSES = {
+PROBLEM_STATUSES = MappingProxyType({
     "Unavailable": State.CRIT,
     "Inaccessible": State.CRIT,
     "Offline": State.CRIT,
     "Maintenance": State.WARN,
     "Warning": State.WARN,
-}
+})
 
 
 def check_veeam_rest_managed_servers(
@@ -146,9 +147,9 @@ def check_veeam_rest_managed_servers(
         # List active components
         components = network_settings.get("components", [])
         active_components = [
-            f"{c['componentName']}:{c['port']}"
+            f"{c.get('componentName', 'Unknown')}:{port}"
             for c in components
-            if c.get("port", -1) > 0
+            if (port := c.get("port") or 0) > 0
         ]
         if active_components:
             yield Result(state=State.OK, notice=f"Components: {', '.join(active_components)}")
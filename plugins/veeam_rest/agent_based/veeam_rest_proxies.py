@@ -6,6 +6,7 @@ Monitors proxy online status and configuration.
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -59,11 +60,11 @@ def discover_veeam_rest_proxies(section: Section) -> DiscoveryResult:
 # CHECK FUNCTION
 # =============================================================================
 
-PROXY_TYPE_MAP = {
+PROXY_TYPE_MAP = MappingProxyType({
     "ViProxy": "VMware vSphere",
     "HvProxy": "Microsoft Hyper-V",
     "GeneralPurposeProxy": "General Purpose",
-}
+})
 
 
 def check_veeam_rest_proxies(
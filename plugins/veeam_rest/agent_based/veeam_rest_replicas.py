@@ -6,6 +6,7 @@ Monitors replica status for disaster recovery.
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -59,10 +60,10 @@ def discover_veeam_rest_replicas(section: Section) -> DiscoveryResult:
 # CHECK FUNCTION
 # =============================================================================
 
-PLATFORM_MAP = {
+PLATFORM_MAP = MappingProxyType({
     "VMware": "vSphere",
     "HyperV": "Hyper-V",
-}
+})
 
 
 def check_veeam_rest_replicas(
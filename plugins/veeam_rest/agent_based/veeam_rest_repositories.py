@@ -6,6 +6,7 @@ Monitors repository capacity, usage, and online status.
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -45,12 +46,7 @@ def parse_veeam_rest_repositories(string_table) -> Section | None:
     data = parse_json_section(string_table)
     if not data or not isinstance(data, list):
         return None
-    result = {}
-    for repo in data:
-        item = _get_repo_item(repo)
-        if item:
-            result[item] = repo
-    return result or None
+    return {item: repo for repo in data if (item := _get_repo_item(repo))} or None
 
 
 agent_section_veeam_rest_repositories = AgentSection(
@@ -100,18 +96,19 @@ REPO_TYPE_CATEGORY = {
 }
 
 
+# Scale-out extent categories by extentType (unknown types count as "SOBR Extent")
+SOBR_EXTENT_CATEGORY = MappingProxyType({
+    "Performance": "SOBR Extent",
+    "Capacity": "SOBR Capacity",
+    "Archive": "SOBR Archive",
+})
+
+
 def _get_repo_category(repo: dict[str, Any]) -> str:
     """Determine the repository category for service naming."""
     # Check if this is a scale-out extent
-    if repo.get("scaleOutRepositoryDetails"):
-        extent_type = repo["scaleOutRepositoryDetails"].get("extentType", "")
-        if extent_type == "Performance":
-            return "SOBR Extent"
-        elif extent_type == "Capacity":
-            return "SOBR Capacity"
-        elif extent_type == "Archive":
-            return "SOBR Archive"
-        return "SOBR Extent"
+    if sobr_details := repo.get("scaleOutRepositoryDetails"):
+        return SOBR_EXTENT_CATEGORY.get(sobr_details.get("extentType", ""), "SOBR Extent")
 
     # Get type from mapping or use raw type
     repo_type = repo.get("type", "Unknown")
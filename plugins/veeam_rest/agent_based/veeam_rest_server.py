@@ -5,7 +5,6 @@ Check plugin for Veeam Backup Server Information.
 Monitors backup server build, patches, and database information.
 """
 
-import json
 from collections.abc import Mapping
 from typing import Any
 
@@ -20,6 +19,8 @@ from cmk.agent_based.v2 import (
     StringTable,
 )
 
+from cmk_addons.plugins.veeam_rest.lib import parse_json_section
+
 
 # =============================================================================
 # SECTION PARSING
@@ -30,14 +31,10 @@ Section = dict[str, Any]
 
 def parse_veeam_rest_server(string_table: StringTable) -> Section | None:
     """Parse JSON output from special agent."""
-    if not string_table:
-        return None
-
-    try:
-        json_str = "".join(line[0] for line in string_table)
-        return json.loads(json_str)
-    except (json.JSONDecodeError, IndexError):
+    data = parse_json_section(string_table)
+    if not isinstance(data, dict):
         return None
+    return data
 
 
 agent_section_veeam_rest_server = AgentSection(
@@ -8,6 +8,7 @@ enriched with task data for VM backups.
 """
 
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cmk.agent_based.v2 import (
@@ -53,11 +54,11 @@ def discover_veeam_rest_vm_backup(section: Section) -> DiscoveryResult:
 # =============================================================================
 
 # Backup object type display names
-TYPE_DISPLAY = {
+TYPE_DISPLAY = MappingProxyType({
     "VirtualMachine": "VM",
     "Computer": "Agent",
     "VCloud": "vCloud",
-}
+})
 
 
 def check_veeam_rest_vm_backup(
@@ -90,15 +91,15 @@ def check_veeam_rest_vm_backup(
     platform = section.get("platformName", "")
     job_name = section.get("jobName")
 
-    summary = f"{result_text}"
+    parts = [result_text]
     if job_name:
-        summary += f", Job: {job_name}"
-    summary += f", Type: {type_display}"
+        parts.append(f", Job: {job_name}")
+    parts.append(f", Type: {type_display}")
     if platform:
-        summary += f" ({platform})"
-    summary += f", Restore points: {restore_point_count}"
+        parts.append(f" ({platform})")
+    parts.append(f", Restore points: {restore_point_count}")
 
-    yield Result(state=result_state, summary=summary)
+    yield Result(state=result_state, summary="".join(parts))
 
     # Yield common backup metrics and checks (restore points, age, task data, malware, etc.)
     yield from yield_backup_metrics(section, params, restore_point_count)
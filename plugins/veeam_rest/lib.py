@@ -4,7 +4,8 @@ Shared utility functions for Veeam REST monitoring plugin.
 """
 
 import json
-from collections.abc import Iterator, Mapping
+import re
+from collections.abc import Mapping
 from typing import Any, TypedDict
 
 from cmk.agent_based.v2 import (
@@ -17,6 +18,22 @@ from cmk.agent_based.v2 import (
     render,
 )
 
+try:
+    # Shipped with Checkmk; parses large sections several times faster
+    import orjson
+
+    def _json_loads(text: str) -> Any:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the agent's json.dumps() emits
+            return json.loads(text)
+
+except ImportError:
+    _json_loads = json.loads
+
+_JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, IndexError)
+
 
 # =============================================================================
 # TYPE DEFINITIONS
@@ -158,9 +175,12 @@ def parse_json_section(string_table: StringTable) -> list[dict[str, Any]] | dict
     if not string_table:
         return None
     try:
+        # The special agent prints each section as a single JSON line
+        if len(string_table) == 1:
+            return _json_loads(string_table[0][0])
         json_str = "".join(line[0] for line in string_table)
-        return json.loads(json_str)
-    except (json.JSONDecodeError, IndexError):
+        return _json_loads(json_str)
+    except _JSON_ERRORS:
         return None
 
 
@@ -168,6 +188,23 @@ def parse_json_section(string_table: StringTable) -> list[dict[str, Any]] | dict
 # RATE & DURATION PARSING
 # =============================================================================
 
+# Support both "MB/S" and "MB" formats (Veeam API inconsistency)
+_RATE_MULTIPLIERS: dict[str, int] = {
+    "B/S": 1,
+    "KB/S": 1024,
+    "MB/S": 1024**2,
+    "GB/S": 1024**3,
+    "TB/S": 1024**4,
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+# "HH:MM:SS" with optional "D." days prefix
+_DURATION_RE = re.compile(r"(?:(\d+)\.)?(\d+):(\d+):(\d+)")
+
 
 def parse_rate_to_bytes_per_second(rate_str: str) -> float | None:
     """Parse rate string like '1,1 GB/s', '500 MB/s', or '131,9 MB' to bytes/second.
@@ -183,22 +220,8 @@ def parse_rate_to_bytes_per_second(rate_str: str) -> float | None:
         if len(parts) != 2:
             return None
         value = float(parts[0])
-        unit = parts[1].upper()
-        # Support both "MB/S" and "MB" formats (Veeam API inconsistency)
-        multipliers = {
-            "B/S": 1,
-            "KB/S": 1024,
-            "MB/S": 1024**2,
-            "GB/S": 1024**3,
-            "TB/S": 1024**4,
-            "B": 1,
-            "KB": 1024,
-            "MB": 1024**2,
-            "GB": 1024**3,
-            "TB": 1024**4,
-        }
-        return value * multipliers.get(unit, 1)
-    except (ValueError, IndexError):
+        return value * _RATE_MULTIPLIERS.get(parts[1].upper(), 1)
+    except ValueError:
         return None
 
 
@@ -206,24 +229,11 @@ def parse_duration_to_seconds(duration_str: str) -> int | None:
     """Parse duration string like '00:03:26' or '1.00:03:26' to seconds."""
     if not duration_str:
         return None
-    try:
-        parts = duration_str.split(":")
-        if len(parts) == 3:
-            # Check if first part contains days (e.g., "1.00")
-            hours_part = parts[0]
-            if "." in hours_part:
-                days_str, hours_str = hours_part.split(".", 1)
-                days = int(days_str)
-                hours = int(hours_str)
-            else:
-                days = 0
-                hours = int(hours_part)
-            minutes = int(parts[1])
-            seconds = int(parts[2])
-            return days * 86400 + hours * 3600 + minutes * 60 + seconds
-    except (ValueError, IndexError):
-        pass
-    return None
+    match = _DURATION_RE.fullmatch(duration_str.strip())
+    if match is None:
+        return None
+    days, hours, minutes, seconds = match.groups(default="0")
+    return int(days) * 86400 + int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
 
 def format_duration_hms(seconds: int) -> str:
@@ -275,6 +285,11 @@ def get_malware_state(malware_status: str, params: Mapping[str, Any]) -> State:
     return effective_mapping.get(malware_status, State.OK)
 
 
+def _fmt_int(value: float) -> str:
+    """Render a count for check_levels (restore points)."""
+    return str(int(value))
+
+
 def yield_backup_metrics(
     data: Mapping[str, Any],
     params: Mapping[str, Any],
@@ -305,7 +320,7 @@ def yield_backup_metrics(
         yield from check_levels(
             restore_point_count,
             levels_lower=("fixed", (min_warn, min_crit)),
-            render_func=lambda x: str(int(x)),
+            render_func=_fmt_int,
             label="Restore points",
             notice_only=True,
         )
@@ -317,7 +332,7 @@ def yield_backup_metrics(
         yield from check_levels(
             restore_point_count,
             levels_upper=("fixed", (max_warn, max_crit)),
-            render_func=lambda x: str(int(x)),
+            render_func=_fmt_int,
             label="Restore points",
             notice_only=True,
         )
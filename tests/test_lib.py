@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared helpers in plugins/veeam_rest/lib.py.
+
+Run inside a Checkmk site, where cmk.agent_based.v2 and the installed
+cmk_addons.plugins.veeam_rest package are importable.
+"""
+
+import json
+import math
+
+from cmk_addons.plugins.veeam_rest.lib import parse_json_section
+
+
+def test_parse_json_section_accepts_nan_and_infinity():
+    # The special agent serializes with json.dumps(), which emits NaN/Infinity
+    line = json.dumps({"rate": float("nan"), "size": float("inf"), "free": float("-inf"), "name": "repo"})
+    section = parse_json_section([[line]])
+    assert section is not None
+    assert math.isnan(section["rate"])
+    assert section["size"] == math.inf
+    assert section["free"] == -math.inf
+    assert section["name"] == "repo"
+
+
+def test_parse_json_section_joins_split_lines():
+    assert parse_json_section([['[{"id": 1,'], [' "speed": NaN}]']])[0]["id"] == 1
+
+
+def test_parse_json_section_invalid_json():
+    assert parse_json_section([["{not json"]]) is None
+    assert parse_json_section([]) is None